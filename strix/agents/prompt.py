@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
@@ -11,6 +12,11 @@ from strix.skills import get_available_skills, load_skills, skill_search_dirs
 from strix.utils.resource_paths import get_strix_resource_path
 
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from jinja2 import Template
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,6 +63,24 @@ def _resolve_skills(
     return deduped
 
 
+@functools.lru_cache(maxsize=8)
+def _system_prompt_template(loader_dirs: tuple[Path, ...]) -> Template:
+    """Parse and compile the system prompt template once per set of search dirs.
+
+    Every agent spawn renders the prompt; only the render inputs differ, so the
+    environment and compiled template are shared. Skill dirs registered later
+    change the key and get their own entry.
+    """
+    env = Environment(
+        loader=FileSystemLoader(loader_dirs),
+        autoescape=select_autoescape(
+            enabled_extensions=(),
+            default_for_string=False,
+        ),
+    )
+    return env.get_template("system_prompt.jinja")
+
+
 def render_system_prompt(
     *,
     skills: list[str] | None = None,
@@ -69,14 +93,7 @@ def render_system_prompt(
     """Render the system prompt. Returns empty string on template failure."""
     try:
         prompt_dir = get_strix_resource_path("agents", _PROMPT_DIRNAME)
-        loader_dirs = [prompt_dir, *skill_search_dirs()]
-        env = Environment(
-            loader=FileSystemLoader(loader_dirs),
-            autoescape=select_autoescape(
-                enabled_extensions=(),
-                default_for_string=False,
-            ),
-        )
+        template = _system_prompt_template((prompt_dir, *skill_search_dirs()))
 
         skills_to_load = _resolve_skills(
             requested=skills,
@@ -85,9 +102,9 @@ def render_system_prompt(
             is_root=is_root,
         )
         skill_content = load_skills(skills_to_load)
-        env.globals["get_skill"] = lambda name: skill_content.get(name, "")
 
-        rendered = env.get_template("system_prompt.jinja").render(
+        rendered = template.render(
+            get_skill=lambda name: skill_content.get(name, ""),
             loaded_skill_names=list(skill_content.keys()),
             available_skills=get_available_skills(),
             interactive=interactive,
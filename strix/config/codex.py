@@ -19,11 +19,11 @@ import secrets
 import threading
 import time
 import urllib.parse
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import requests
 
+from strix.core.paths import STRIX_HOME
 from strix.utils.secret_files import write_secret_text
 
 
@@ -57,7 +57,7 @@ _EXPIRY_SKEW_S = 300
 _refresh_lock = threading.Lock()
 
 # Kept separate from cli-config.json so OAuth tokens never land in the env-var config.
-AUTH_PATH = Path.home() / ".strix" / "subscription-auth.json"
+AUTH_PATH = STRIX_HOME / "subscription-auth.json"
 
 
 def _read_store() -> dict[str, Any]:
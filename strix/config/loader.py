@@ -5,23 +5,25 @@ from __future__ import annotations
 import json
 import logging
 import os
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from pydantic import AliasChoices, BaseModel
 
 from strix.config.settings import Settings
+from strix.core.paths import STRIX_HOME
 from strix.utils.secret_files import write_secret_text
 
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pydantic.fields import FieldInfo
 
 
 logger = logging.getLogger(__name__)
 
 
-_DEFAULT_PATH: Path = Path.home() / ".strix" / "cli-config.json"
+_DEFAULT_PATH: Path = STRIX_HOME / "cli-config.json"
 _override: Path | None = None
 _cached: Settings | None = None
 
@@ -37,9 +39,9 @@ def load_settings() -> Settings:
         init_kwargs: dict[str, Any] = _read_json_overrides(source_path)
         _cached = Settings(**init_kwargs)
         logger.debug(
-            "load_settings: resolved (override=%s, file_used=%s, json_keys=%d)",
+            "load_settings: resolved (override=%s, source=%s, json_keys=%d)",
             _override is not None,
-            source_path.exists(),
+            source_path,
             sum(len(v) for v in init_kwargs.values()),
         )
     return _cached
@@ -54,23 +56,30 @@ def apply_config_override(path: Path) -> None:
 
 
 def persist_current() -> None:
-    """Write currently-set env vars to the active config file (0o600)."""
-    s = load_settings()
+    """Merge currently-set env vars into the active config file (0o600).
+
+    Keys already persisted but not set in this process are kept, so a run
+    configured purely from the file does not erase it.
+    """
     target = _override or _DEFAULT_PATH
-    target.parent.mkdir(parents=True, exist_ok=True)
 
-    env_block: dict[str, str] = {}
-    for sub_name in s.model_fields:
-        sub_model = getattr(s, sub_name)
-        if not isinstance(sub_model, BaseModel):
+    env = os.environ
+    # One C-level intersection instead of a getenv per tracked alias.
+    present = {name for name in _TRACKED_ENV_VARS & env.keys() if env[name]}
+
+    stored = _read_env_block(target)
+    env_block = {str(k).upper(): v for k, v in (stored or {}).items()}
+    for _, _, aliases in _TRACKED_FIELDS:
+        alias = next((a for a in aliases if a in present), None)
+        if alias is None:
             continue
-        for finfo in type(sub_model).model_fields.values():
-            for alias in _aliases_for(finfo):
-                value = os.environ.get(alias.upper())
-                if value:
-                    env_block[alias.upper()] = value
-                    break
+        # Drop sibling aliases so a stale value can't shadow the fresh one on load.
+        for other in aliases:
+            env_block.pop(other, None)
+        env_block[alias] = env[alias]
 
+    if env_block == stored:
+        return  # file already holds this block; skip the temp-file write and rename
     write_secret_text(target, json.dumps({"env": env_block}, indent=2))
 
 
@@ -87,39 +96,54 @@ def _aliases_for(finfo: FieldInfo) -> list[str]:
     return aliases
 
 
+def _read_env_block(path: Path) -> dict[str, Any] | None:
+    """Return the ``env`` mapping persisted at ``path`` (None if absent or unusable)."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):  # includes FileNotFoundError
+        return None
+    env_block = data.get("env") if isinstance(data, dict) else None
+    return env_block if isinstance(env_block, dict) else None
+
+
 def _read_json_overrides(path: Path) -> dict[str, dict[str, Any]]:
     """Read ``{"env": {...}}`` from ``path`` and remap to nested kwargs.
 
     Only includes keys whose env var is NOT already set, so env always
     wins over the persisted file.
     """
-    if not path.exists():
-        return {}
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return {}
-    env_block = data.get("env", {}) if isinstance(data, dict) else {}
-    if not isinstance(env_block, dict):
-        return {}
-
+    env_block = _read_env_block(path)
+    if not env_block:
+        return {}  # common first-run case: skip the environ scan and field walk
     env_block_upper = {str(k).upper(): v for k, v in env_block.items()}
     env_present = {k.upper() for k in os.environ}
 
     nested: dict[str, dict[str, Any]] = {}
+    for sub_name, fname, aliases in _TRACKED_FIELDS:
+        if any(alias in env_present for alias in aliases):
+            continue  # env wins under some alias; skip the JSON file for this field
+        for alias in aliases:
+            if alias in env_block_upper:
+                nested.setdefault(sub_name, {})[fname] = env_block_upper[alias]
+                break
+    return nested
+
+
+def _build_tracked_fields() -> tuple[tuple[str, str, tuple[str, ...]], ...]:
+    """Flatten ``Settings`` into ``(sub_model, field, UPPERCASE_ALIASES)`` rows."""
+    rows: list[tuple[str, str, tuple[str, ...]]] = []
     for sub_name, sub_finfo in Settings.model_fields.items():
         sub_cls = sub_finfo.annotation
         if not (isinstance(sub_cls, type) and issubclass(sub_cls, BaseModel)):
             continue
-        sub_data: dict[str, Any] = {}
         for fname, finfo in sub_cls.model_fields.items():
-            aliases = [alias.upper() for alias in _aliases_for(finfo)]
-            if any(alias in env_present for alias in aliases):
-                continue  # env wins under some alias; skip the JSON file for this field
-            for alias in aliases:
-                if alias in env_block_upper:
-                    sub_data[fname] = env_block_upper[alias]
-                    break
-        if sub_data:
-            nested[sub_name] = sub_data
-    return nested
+            aliases = tuple(dict.fromkeys(alias.upper() for alias in _aliases_for(finfo)))
+            if aliases:
+                rows.append((sub_name, fname, aliases))
+    return tuple(rows)
+
+
+# The settings schema is fixed at import time, so resolve the field/alias
+# table once instead of re-walking ``model_fields`` on every load and persist.
+_TRACKED_FIELDS = _build_tracked_fields()
+_TRACKED_ENV_VARS = frozenset(alias for _, _, aliases in _TRACKED_FIELDS for alias in aliases)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import inspect
 import logging
 import os
@@ -502,10 +503,11 @@ DEFAULT_MODEL_RETRY = ModelRetrySettings(
         initial_delay=2.0,
         max_delay=90.0,
         multiplier=2.0,
-        jitter=False,
+        jitter=True,
     ),
     policy=retry_policies.any(
         retry_policies.provider_suggested(),
+        retry_policies.retry_after(),
         retry_policies.network_error(),
         retry_policies.http_status((429, 500, 502, 503, 504)),
         _retry_statusless_provider_errors,
@@ -573,23 +575,33 @@ def configure_sdk_model_defaults(settings: Settings) -> None:
     _configure_extra_headers(llm)
 
 
+_SDK_ROUTE_PREFIXES = ("litellm/", "any-llm/")
+
+
+def _strip_route_prefix(name: str, prefixes: tuple[str, ...] = _SDK_ROUTE_PREFIXES) -> str:
+    """Drop the first matching routing prefix from an already-lowercased name."""
+    for prefix in prefixes:
+        if name.startswith(prefix):
+            return name[len(prefix) :]
+    return name
+
+
 def _mirror_api_key_to_provider_env(model_name: str | None, api_key: str) -> None:
     if not model_name:
         return
     import litellm
 
-    name = model_name.strip()
-    for prefix in ("litellm/", "any-llm/"):
-        if name.lower().startswith(prefix):
-            name = name[len(prefix) :]
-            break
+    name = _strip_route_prefix(model_name.strip().lower())
     try:
-        report = litellm.validate_environment(model=name.lower())
+        report = litellm.validate_environment(model=name)
     except Exception:  # noqa: BLE001
         return
-    for env_key in report.get("missing_keys") or []:
-        if env_key.endswith("_API_KEY"):
-            os.environ.setdefault(env_key, api_key)
+    mirrored = {
+        env_key: api_key
+        for env_key in report.get("missing_keys") or []
+        if env_key.endswith("_API_KEY") and env_key not in os.environ
+    }
+    os.environ.update(mirrored)
 
 
 def _configure_litellm_compatibility() -> None:
@@ -631,9 +643,12 @@ def _install_openrouter_stream_cost_capture() -> None:
     class _StrixOpenRouterStreamingHandler(OpenRouterChatCompletionStreamingHandler):
         def chunk_parser(self, chunk: dict[str, Any]) -> Any:
             stream = super().chunk_parser(chunk)
-            streamed_openrouter_costs.remember(
-                chunk.get("id") or getattr(stream, "id", None), chunk.get("usage")
-            )
+            # Only the final chunk carries usage; skip the lookup on content deltas.
+            usage = chunk.get("usage")
+            if usage:
+                streamed_openrouter_costs.remember(
+                    chunk.get("id") or getattr(stream, "id", None), usage
+                )
             return stream
 
     class _StrixOpenrouterConfig(OpenrouterConfig):
@@ -745,14 +760,11 @@ def uses_chat_completions_tool_schema(model_name: str, settings: Settings) -> bo
     return not model_supports_reasoning(model_name)
 
 
+@functools.lru_cache(maxsize=32)
 def model_supports_reasoning(model_name: str) -> bool:
     import litellm
 
-    name = model_name.strip().lower()
-    for prefix in ("litellm/", "any-llm/", "openai/"):
-        if name.startswith(prefix):
-            name = name[len(prefix) :]
-            break
+    name = _strip_route_prefix(model_name.strip().lower(), (*_SDK_ROUTE_PREFIXES, "openai/"))
     entry = litellm.model_cost.get(name)
     if entry is None and "/" in name:
         entry = litellm.model_cost.get(name.rsplit("/", 1)[1])
@@ -774,12 +786,7 @@ def is_recommended_or_frontier_model(model_name: str) -> bool:
 
 
 def _normalized_model_name(model_name: str) -> str:
-    name = model_name.strip().lower()
-    for prefix in ("litellm/", "any-llm/"):
-        if name.startswith(prefix):
-            name = name[len(prefix) :]
-            break
-    return name
+    return _strip_route_prefix(model_name.strip().lower())
 
 
 def _split_model_provider(model_name: str) -> tuple[str | None, str]:
@@ -853,11 +860,7 @@ def is_bedrock_route(model_name: str) -> bool:
 def _prompt_cache_name_candidates(model_name: str) -> list[str]:
     # LiteLLM's model map keys the same model under several names; strip the
     # route prefix, then leading dotted segments (region, provider).
-    name = (model_name or "").strip().lower()
-    for prefix in ("litellm/", "bedrock/"):
-        if name.startswith(prefix):
-            name = name[len(prefix) :]
-            break
+    name = _strip_route_prefix((model_name or "").strip().lower(), ("litellm/", "bedrock/"))
     candidates = [name]
     rest = name
     while "." in rest:
@@ -866,6 +869,7 @@ def _prompt_cache_name_candidates(model_name: str) -> list[str]:
     return candidates
 
 
+@functools.lru_cache(maxsize=32)
 def bedrock_route_supports_prompt_caching(model_name: str) -> bool:
     # Bedrock rejects the cache marker for models LiteLLM's map doesn't
     # recognise as cache-capable, so callers withhold it unless confirmed here.
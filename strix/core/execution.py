@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import random
 import uuid
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, cast
@@ -130,9 +131,32 @@ def _is_transient_model_error(exc: BaseException) -> bool:
     return isinstance(exc, APIError)
 
 
-def _transient_model_retry_delay(attempt: int) -> float:
+def _model_error_retry_after(exc: BaseException) -> float | None:
+    """Seconds the provider asked us to wait, from a ``Retry-After`` header."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
+    try:
+        value = float(headers.get("retry-after", ""))
+    except (TypeError, ValueError):
+        return None
+    return value if value >= 0 else None
+
+
+def _transient_model_retry_delay(attempt: int, exc: BaseException | None = None) -> float:
+    """Backoff before replaying a failed turn.
+
+    A provider ``Retry-After`` wins when present. Otherwise the exponential
+    delay is jittered so sibling agents that failed together don't retry in
+    lockstep.
+    """
+    retry_after = _model_error_retry_after(exc) if exc is not None else None
+    if retry_after is not None:
+        return min(retry_after, _TRANSIENT_MODEL_RETRY_MAX_DELAY_S)
     delay = _TRANSIENT_MODEL_RETRY_BASE_DELAY_S * float(2 ** (attempt - 1))
-    return min(delay, _TRANSIENT_MODEL_RETRY_MAX_DELAY_S)
+    delay *= random.uniform(0.5, 1.5)  # noqa: S311
+    return min(max(delay, _TRANSIENT_MODEL_RETRY_BASE_DELAY_S), _TRANSIENT_MODEL_RETRY_MAX_DELAY_S)
 
 
 async def _salvage_stream_to_session(
@@ -759,7 +783,7 @@ async def _run_cycle(  # noqa: PLR0912, PLR0915
                     continue
             if model_retries < _MAX_TRANSIENT_MODEL_RETRIES and _is_transient_model_error(exc):
                 model_retries += 1
-                delay = _transient_model_retry_delay(model_retries)
+                delay = _transient_model_retry_delay(model_retries, exc)
                 logger.warning(
                     "transient model/provider error for %s; replaying turn "
                     "(attempt %d/%d, backoff %.1fs): %r",
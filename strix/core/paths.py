@@ -9,6 +9,10 @@ RUNS_DIR_NAME = "strix_runs"
 RUNTIME_STATE_DIR_NAME = ".state"
 RUN_RECORD_FILENAME = "run.json"
 
+# Per-user state (config, auth, caches). Resolved once; every module that
+# keeps a file here derives its path from this instead of calling Path.home().
+STRIX_HOME = Path.home() / ".strix"
+
 
 def run_dir_for(run_name: str, *, cwd: Path | None = None) -> Path:
     base = cwd or Path.cwd()
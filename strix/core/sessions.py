@@ -182,15 +182,33 @@ async def enforce_image_budget(session: Session, max_images: int) -> bool:
 
 
 def scrub_images_from_items(items: list[Any]) -> list[Any]:
-    """Return a copy of ``items`` with every image block replaced by text."""
+    """Return ``items`` with every image block replaced by text.
+
+    Only containers on the path to an image are rebuilt; image-free items and
+    subtrees are shared with the input rather than copied.
+    """
 
     def _scrub(obj: Any) -> Any:
         if isinstance(obj, dict):
             if obj.get("type") == "input_image":
                 return {"type": "input_text", "text": _INHERITED_IMAGE_TEXT}
-            return {k: _scrub(v) for k, v in obj.items()}
+            scrubbed: dict[Any, Any] | None = None
+            for key, value in obj.items():
+                new_value = _scrub(value)
+                if new_value is not value:
+                    if scrubbed is None:
+                        scrubbed = dict(obj)
+                    scrubbed[key] = new_value
+            return obj if scrubbed is None else scrubbed
         if isinstance(obj, list):
-            return [_scrub(v) for v in obj]
+            scrubbed_list: list[Any] | None = None
+            for index, value in enumerate(obj):
+                new_value = _scrub(value)
+                if new_value is not value:
+                    if scrubbed_list is None:
+                        scrubbed_list = list(obj)
+                    scrubbed_list[index] = new_value
+            return obj if scrubbed_list is None else scrubbed_list
         return obj
 
     return [_scrub(item) for item in items]
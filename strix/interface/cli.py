@@ -4,7 +4,6 @@ import logging
 import signal
 import sys
 import threading
-import time
 from typing import Any
 
 from rich.console import Console
@@ -14,9 +13,7 @@ from rich.text import Text
 
 from strix.config import load_settings
 from strix.config.settings import DEFAULT_MAX_TURNS
-from strix.core.runner import run_strix_scan
 from strix.report.state import ReportState, set_global_report_state
-from strix.runtime import session_manager
 
 from .utils import (
     build_live_stats_text,
@@ -27,6 +24,46 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+# Shared by every streamed finding; only the title and body vary per report.
+_VULN_PANEL_STYLE: dict[str, Any] = {
+    "title_align": "left",
+    "border_style": "red",
+    "padding": (1, 2),
+}
+
+
+_active_report_state: ReportState | None = None
+_exit_hooks_installed = False
+
+
+def _cleanup_on_exit() -> None:
+    if _active_report_state is not None:
+        _active_report_state.cleanup()
+
+
+def _signal_handler(_signum: int, _frame: Any) -> None:
+    if _active_report_state is not None:
+        _active_report_state.cleanup(status="interrupted")
+    sys.exit(1)
+
+
+def _install_exit_hooks(report_state: ReportState) -> None:
+    """Point the exit hooks at ``report_state``, registering them only once.
+
+    Re-entering ``run_cli`` (tests, embedding) must not stack another atexit
+    callback or re-bind the handlers to a stale run.
+    """
+    global _active_report_state, _exit_hooks_installed  # noqa: PLW0603
+    _active_report_state = report_state
+    if _exit_hooks_installed:
+        return
+    atexit.register(_cleanup_on_exit)
+    signal.signal(signal.SIGINT, _signal_handler)
+    signal.signal(signal.SIGTERM, _signal_handler)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, _signal_handler)
+    _exit_hooks_installed = True
+
 
 def _resolve_sandbox_image() -> str:
     image = load_settings().runtime.image
@@ -40,37 +77,26 @@ def _resolve_sandbox_image() -> str:
 async def run_cli(args: Any) -> None:  # noqa: PLR0915
     console = Console()
 
-    start_text = Text()
-    start_text.append("Penetration test initiated", style="bold #22c55e")
-
-    target_text = Text()
-    target_text.append("Target", style="dim")
-    target_text.append("  ")
-    if len(args.targets_info) == 1:
-        target_text.append(args.targets_info[0]["original"], style="bold white")
+    targets = args.targets_info
+    if len(targets) == 1:
+        target_parts: list[str | tuple[str, str]] = [(targets[0]["original"], "bold white")]
     else:
-        target_text.append(f"{len(args.targets_info)} targets", style="bold white")
-        for target_info in args.targets_info:
-            target_text.append("\n        ")
-            target_text.append(target_info["original"], style="white")
-
-    results_text = Text()
-    results_text.append("Output", style="dim")
-    results_text.append("  ")
-    results_text.append(f"strix_runs/{args.run_name}", style="#60a5fa")
-
-    note_text = Text()
-    note_text.append("\n\n", style="dim")
-    note_text.append("Vulnerabilities will be displayed in real-time.", style="dim")
+        target_parts = [(f"{len(targets)} targets", "bold white")]
+        for target_info in targets:
+            target_parts += ["\n        ", (target_info["original"], "white")]
 
     startup_panel = Panel(
         Text.assemble(
-            start_text,
+            ("Penetration test initiated", "bold #22c55e"),
             "\n\n",
-            target_text,
+            ("Target", "dim"),
+            "  ",
+            *target_parts,
             "\n",
-            results_text,
-            note_text,
+            ("Output", "dim"),
+            "  ",
+            (f"strix_runs/{args.run_name}", "#60a5fa"),
+            ("\n\nVulnerabilities will be displayed in real-time.", "dim"),
         ),
         title="[bold white]STRIX",
         title_align="left",
@@ -82,6 +108,11 @@ async def run_cli(args: Any) -> None:  # noqa: PLR0915
     console.print(startup_panel)
     console.print()
 
+    # The runner drags in the agent, SDK, and LiteLLM stack (seconds of import
+    # time); load it after the startup panel so the CLI paints immediately.
+    from strix.core.runner import run_strix_scan
+    from strix.runtime import session_manager
+
     scan_mode = getattr(args, "scan_mode", "deep")
 
     scan_config: dict[str, Any] = {
@@ -108,37 +139,19 @@ async def run_cli(args: Any) -> None:  # noqa: PLR0915
 
         vuln_text = format_vulnerability_report(report)
 
-        vuln_panel = Panel(
-            vuln_text,
-            title=f"[bold red]{report_id.upper()}",
-            title_align="left",
-            border_style="red",
-            padding=(1, 2),
-        )
+        vuln_panel = Panel(vuln_text, title=f"[bold red]{report_id.upper()}", **_VULN_PANEL_STYLE)
 
         console.print(vuln_panel)
         console.print()
 
     report_state.vulnerability_found_callback = display_vulnerability
 
-    def cleanup_on_exit() -> None:
-        report_state.cleanup()
-
-    def signal_handler(_signum: int, _frame: Any) -> None:
-        report_state.cleanup(status="interrupted")
-        sys.exit(1)
-
-    atexit.register(cleanup_on_exit)
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    if hasattr(signal, "SIGHUP"):
-        signal.signal(signal.SIGHUP, signal_handler)
-
+    _install_exit_hooks(report_state)
     set_global_report_state(report_state)
 
     startup_phase: list[str] = ["Starting up"]
 
-    def create_live_status() -> Panel:
+    def create_live_status_text() -> Text:
         status_text = Text()
         status_text.append("Penetration test in progress", style="bold #22c55e")
         status_text.append("\n\n")
@@ -150,7 +163,9 @@ async def run_cli(args: Any) -> None:  # noqa: PLR0915
         stats_text = build_live_stats_text(report_state)
         if stats_text:
             status_text.append(stats_text)
+        return status_text
 
+    def create_live_status(status_text: Text) -> Panel:
         return Panel(
             status_text,
             title="[bold white]STRIX",
@@ -165,16 +180,24 @@ async def run_cli(args: Any) -> None:  # noqa: PLR0915
     try:
         console.print()
 
+        # Redraw only when the status content or terminal size changes; Rich's
+        # auto-refresh would re-run layout on an unchanged panel twice a second.
+        initial_text = create_live_status_text()
         with Live(
-            create_live_status(), console=console, refresh_per_second=2, transient=False
+            create_live_status(initial_text), console=console, auto_refresh=False, transient=False
         ) as live:
             stop_updates = threading.Event()
 
             def update_status() -> None:
+                last_key = (initial_text.plain, console.size)
                 while not stop_updates.is_set():
                     try:
-                        live.update(create_live_status())
-                        time.sleep(2)
+                        status_text = create_live_status_text()
+                        key = (status_text.plain, console.size)
+                        if key != last_key:
+                            live.update(create_live_status(status_text), refresh=True)
+                            last_key = key
+                        stop_updates.wait(2)
                     except Exception:
                         break
 
@@ -211,12 +234,9 @@ async def run_cli(args: Any) -> None:  # noqa: PLR0915
     if report_state.final_scan_result:
         console.print()
 
-        final_report_text = Text()
-        final_report_text.append("Penetration test summary", style="bold #60a5fa")
-
         final_report_panel = Panel(
             Text.assemble(
-                final_report_text,
+                ("Penetration test summary", "bold #60a5fa"),
                 "\n\n",
                 report_state.final_scan_result,
             ),
@@ -281,8 +281,8 @@ Examples:
                 "--resume picks up where the prior run left off, including the "
                 "original target list."
             )
-        _load_resume_state(args, parser)
-        agents_path = runtime_state_dir(run_dir_for(args.resume)) / "agents.json"
+        run_dir = _load_resume_state(args, parser)
+        agents_path = runtime_state_dir(run_dir) / "agents.json"
         if not agents_path.exists():
             parser.error(
                 f"--resume {args.resume}: missing {agents_path}. The run was "
@@ -311,8 +311,11 @@ Examples:
     return args
 
 
-def _load_resume_state(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
-    """Populate ``args.targets_info`` and friends from a prior run's run.json."""
+def _load_resume_state(args: argparse.Namespace, parser: argparse.ArgumentParser) -> Path:
+    """Populate ``args.targets_info`` and friends from a prior run's run.json.
+
+    Returns the resumed run's directory.
+    """
     from strix.report.writer import read_run_record
 
     run_dir = run_dir_for(args.resume)
@@ -377,3 +380,4 @@ def _load_resume_state(args: argparse.Namespace, parser: argparse.ArgumentParser
     persisted_scan_mode = state.get("scan_mode")
     if persisted_scan_mode and args.scan_mode == "deep":
         args.scan_mode = persisted_scan_mode
+    return run_dir
@@ -1,8 +1,11 @@
 """Startup environment validation and Docker image management."""
 
+import contextlib
+import functools
 import logging
 import shutil
 import sys
+import threading
 
 from rich.console import Console
 from rich.panel import Panel
@@ -10,6 +13,7 @@ from rich.text import Text
 
 from strix.config import codex, load_settings
 from strix.interface.utils import (
+    PullProgress,
     check_docker_connection,
     image_exists,
     process_pull_line,
@@ -18,6 +22,46 @@ from strix.interface.utils import (
 
 logger = logging.getLogger(__name__)
 
+# Images confirmed present (already local or pulled) in this process. Only the
+# positive answer is kept: a missing image must be re-checked after a pull.
+_ready_images: set[str] = set()
+
+
+# Help shown for each missing variable: (description, example export line).
+_ENV_VAR_HELP: dict[str, tuple[str, str]] = {
+    "STRIX_LLM": (
+        " - Model name to use (e.g., 'openai/gpt-5.4' or 'anthropic/claude-opus-4-7')\n",
+        "",
+    ),
+    "LLM_API_BASE": (
+        " - Custom API base URL if using local models (e.g., Ollama, LMStudio)\n",
+        "export LLM_API_BASE='http://localhost:11434'  # needed for local models only\n",
+    ),
+    "PERPLEXITY_API_KEY": (
+        " - API key for Perplexity AI web search (enables real-time research)\n",
+        "export PERPLEXITY_API_KEY='your-perplexity-key-here'\n",
+    ),
+    "STRIX_REASONING_EFFORT": (
+        " - Reasoning effort level: none, minimal, low, medium, high, xhigh, max (default: high)\n",
+        "export STRIX_REASONING_EFFORT='high'\n",
+    ),
+}
+
+_DOCKER_MISSING_SEGMENTS: tuple[str | tuple[str, str], ...] = (
+    ("DOCKER NOT INSTALLED", "bold red"),
+    "\n\n",
+    ("The 'docker' CLI was not found in your PATH.\n", "white"),
+    ("Please install Docker and ensure the 'docker' command is available.\n\n", "white"),
+)
+
+
+def _var_help_segments(names: list[str]) -> list[str | tuple[str, str]]:
+    segments: list[str | tuple[str, str]] = []
+    for name in names:
+        if name in _ENV_VAR_HELP:
+            segments += [("• ", "white"), (name, "bold cyan"), (_ENV_VAR_HELP[name][0], "white")]
+    return segments
+
 
 def validate_environment() -> None:
     logger.info("Validating environment")
@@ -50,77 +94,35 @@ def validate_environment() -> None:
         missing_optional_vars.append("PERPLEXITY_API_KEY")
 
     if missing_required_vars:
-        error_text = Text()
-        error_text.append("MISSING REQUIRED ENVIRONMENT VARIABLES", style="bold red")
-        error_text.append("\n\n", style="white")
-
+        segments: list[str | tuple[str, str]] = [
+            ("MISSING REQUIRED ENVIRONMENT VARIABLES", "bold red"),
+            "\n\n",
+        ]
         for var in missing_required_vars:
-            error_text.append(f"• {var}", style="bold yellow")
-            error_text.append(" is not set\n", style="white")
+            segments += [(f"• {var}", "bold yellow"), (" is not set\n", "white")]
 
         if missing_optional_vars:
-            error_text.append("\nOptional environment variables:\n", style="dim white")
+            segments.append(("\nOptional environment variables:\n", "dim white"))
             for var in missing_optional_vars:
-                error_text.append(f"• {var}", style="dim yellow")
-                error_text.append(" is not set\n", style="dim white")
-
-        error_text.append("\nRequired environment variables:\n", style="white")
-        for var in missing_required_vars:
-            if var == "STRIX_LLM":
-                error_text.append("• ", style="white")
-                error_text.append("STRIX_LLM", style="bold cyan")
-                error_text.append(
-                    " - Model name to use (e.g., 'openai/gpt-5.4' or "
-                    "'anthropic/claude-opus-4-7')\n",
-                    style="white",
-                )
+                segments += [(f"• {var}", "dim yellow"), (" is not set\n", "dim white")]
 
-        if missing_optional_vars:
-            error_text.append("\nOptional environment variables:\n", style="white")
-            for var in missing_optional_vars:
-                if var == "LLM_API_BASE":
-                    error_text.append("• ", style="white")
-                    error_text.append("LLM_API_BASE", style="bold cyan")
-                    error_text.append(
-                        " - Custom API base URL if using local models (e.g., Ollama, LMStudio)\n",
-                        style="white",
-                    )
-                elif var == "PERPLEXITY_API_KEY":
-                    error_text.append("• ", style="white")
-                    error_text.append("PERPLEXITY_API_KEY", style="bold cyan")
-                    error_text.append(
-                        " - API key for Perplexity AI web search (enables real-time research)\n",
-                        style="white",
-                    )
-                elif var == "STRIX_REASONING_EFFORT":
-                    error_text.append("• ", style="white")
-                    error_text.append("STRIX_REASONING_EFFORT", style="bold cyan")
-                    error_text.append(
-                        " - Reasoning effort level: none, minimal, low, medium, high, xhigh, "
-                        "max (default: high)\n",
-                        style="white",
-                    )
-
-        error_text.append("\nExample setup:\n", style="white")
-        error_text.append("export STRIX_LLM='openai/gpt-5.4'\n", style="dim white")
+        segments.append(("\nRequired environment variables:\n", "white"))
+        segments += _var_help_segments(missing_required_vars)
 
         if missing_optional_vars:
-            for var in missing_optional_vars:
-                if var == "LLM_API_BASE":
-                    error_text.append(
-                        "export LLM_API_BASE='http://localhost:11434'  "
-                        "# needed for local models only\n",
-                        style="dim white",
-                    )
-                elif var == "PERPLEXITY_API_KEY":
-                    error_text.append(
-                        "export PERPLEXITY_API_KEY='your-perplexity-key-here'\n", style="dim white"
-                    )
-                elif var == "STRIX_REASONING_EFFORT":
-                    error_text.append(
-                        "export STRIX_REASONING_EFFORT='high'\n",
-                        style="dim white",
-                    )
+            segments.append(("\nOptional environment variables:\n", "white"))
+            segments += _var_help_segments(missing_optional_vars)
+
+        segments += [
+            ("\nExample setup:\n", "white"),
+            ("export STRIX_LLM='openai/gpt-5.4'\n", "dim white"),
+        ]
+        segments += [
+            (_ENV_VAR_HELP[var][1], "dim white")
+            for var in missing_optional_vars
+            if var in _ENV_VAR_HELP
+        ]
+        error_text = Text.assemble(*segments)
 
         panel = Panel(
             error_text,
@@ -141,17 +143,16 @@ def validate_environment() -> None:
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _docker_cli_path() -> str | None:
+    return shutil.which("docker")
+
+
 def check_docker_installed() -> None:
-    if shutil.which("docker") is None:
+    if _docker_cli_path() is None:
         logger.debug("Docker CLI not found in PATH")
         console = Console()
-        error_text = Text()
-        error_text.append("DOCKER NOT INSTALLED", style="bold red")
-        error_text.append("\n\n", style="white")
-        error_text.append("The 'docker' CLI was not found in your PATH.\n", style="white")
-        error_text.append(
-            "Please install Docker and ensure the 'docker' command is available.\n\n", style="white"
-        )
+        error_text = Text.assemble(*_DOCKER_MISSING_SEGMENTS)
 
         panel = Panel(
             error_text,
@@ -165,16 +166,41 @@ def check_docker_installed() -> None:
     logger.debug("Docker CLI present")
 
 
-def pull_docker_image() -> None:
+class _PlainStatus:
+    """``console.status`` stand-in that prints each update as its own line.
+
+    Updates stop once ``stop`` is set, so nothing lands in the middle of output
+    another thread prints afterwards.
+    """
+
+    def __init__(self, console: Console, stop: threading.Event) -> None:
+        self._console = console
+        self._stop = stop
+
+    def update(self, status: str) -> None:
+        if not self._stop.is_set():
+            self._console.print(status)
+
+
+def pull_docker_image(stop: threading.Event | None = None) -> None:
+    """Make sure the sandbox image is present locally, pulling it if needed.
+
+    With ``stop`` the pull runs alongside other startup output: progress is
+    printed as plain lines rather than a live spinner, and once ``stop`` is set
+    the pull prints nothing more and returns at its next progress line.
+    """
     from docker.errors import DockerException
 
+    image = load_settings().runtime.image
+    if image in _ready_images:
+        return
+
     console = Console()
     client = check_docker_connection()
 
-    image = load_settings().runtime.image
-
     if image_exists(client, image):
         logger.debug("Docker image already present locally: %s", image)
+        _ready_images.add(image)
         return
 
     logger.info("Pulling docker image: %s", image)
@@ -183,16 +209,23 @@ def pull_docker_image() -> None:
     console.print("[dim yellow]This only happens on first run and may take a few minutes...[/]")
     console.print()
 
-    with console.status("[bold cyan]Downloading image layers...", spinner="dots") as status:
+    status_context = (
+        console.status("[bold cyan]Downloading image layers...", spinner="dots")
+        if stop is None
+        else contextlib.nullcontext(_PlainStatus(console, stop))
+    )
+    with status_context as status:
         try:
-            layers_info: dict[str, str] = {}
-            last_update = ""
-
+            progress = PullProgress()
             for line in client.api.pull(image, stream=True, decode=True):
-                last_update = process_pull_line(line, layers_info, status, last_update)
+                if stop is not None and stop.is_set():
+                    return
+                process_pull_line(line, progress, status)
 
         except DockerException as e:
             logger.debug("Failed to pull docker image %s", image, exc_info=True)
+            if stop is not None and stop.is_set():
+                return
             console.print()
             error_text = Text()
             error_text.append("FAILED TO PULL IMAGE", style="bold red")
@@ -211,6 +244,9 @@ def pull_docker_image() -> None:
             sys.exit(1)
 
     logger.info("Docker image %s ready", image)
+    _ready_images.add(image)
+    if stop is not None and stop.is_set():
+        return
     success_text = Text()
     success_text.append("Docker image ready", style="#22c55e")
     console.print(success_text)
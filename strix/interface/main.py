@@ -8,13 +8,15 @@ import asyncio
 import contextlib
 import os
 import sys
+import threading
+from collections.abc import Awaitable
 from pathlib import Path
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
-from strix.config import codex, load_settings, persist_current
+from strix.config import Settings, codex, load_settings, persist_current
 from strix.core.paths import run_dir_for
 from strix.interface.cli_args import parse_arguments
 from strix.interface.environment import (
@@ -126,18 +128,64 @@ def _subscription_error_hint(exc: BaseException) -> str | None:
     return None
 
 
-async def warm_up_llm(show_model_warning: bool = True) -> None:
+async def _warm_up_model_route(model_name: str, check: Awaitable[None]) -> None:
+    try:
+        await check
+    except ModelConnectionError:
+        raise
+    except Exception as exc:
+        raise ModelConnectionError(model_name, exc) from exc
+
+
+async def _warm_up_dedupe_model(settings: Settings) -> None:
     from agents.model_settings import ModelSettings
     from agents.models.interface import ModelTracing
 
+    from strix.config.models import StrixProvider
+    from strix.core.inputs import make_model_settings
+    from strix.report.dedupe import _dedupe_extra_args
+
+    dedupe_model = (settings.dedupe.model or "").strip()
+    deduper = StrixProvider().get_model(dedupe_model)
+    deduper_extra = _dedupe_extra_args(settings.dedupe)
+    # A dedicated dedupe model may route to another provider, which must
+    # never receive the main endpoint's headers; it has its own
+    # DEDUPE_LLM_EXTRA_HEADERS.
+    deduper_settings = make_model_settings(
+        None,
+        model_name=dedupe_model,
+        request_timeout=settings.llm.timeout,
+        prompt_cache=False,
+        extra_headers=settings.dedupe.extra_headers,
+    )
+    if deduper_extra:
+        merged = {**(deduper_settings.extra_args or {}), **deduper_extra}
+        deduper_settings = deduper_settings.resolve(ModelSettings(extra_args=merged))
+    await asyncio.wait_for(
+        deduper.get_response(
+            system_instructions="You are a helpful assistant.",
+            input="Reply with just 'OK'.",
+            model_settings=deduper_settings,
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=ModelTracing.DISABLED,
+            previous_response_id=None,
+            conversation_id=None,
+            prompt=None,
+        ),
+        timeout=settings.llm.timeout,
+    )
+    logger.info("LLM warm-up succeeded for dedupe model %s", dedupe_model)
+
+
+async def warm_up_llm(show_model_warning: bool = True) -> None:
     from strix.config.models import (
         RECOMMENDED_MODEL_NAMES,
-        StrixProvider,
         configure_sdk_model_defaults,
         is_known_openai_bare_model,
         is_recommended_or_frontier_model,
     )
-    from strix.core.inputs import make_model_settings
 
     console = Console()
     logger.info("Warming up LLM connection")
@@ -205,45 +253,17 @@ async def warm_up_llm(show_model_warning: bool = True) -> None:
                 ),
             )
 
-        await preflight_model_connection(raw_model, settings=settings)
-        logger.info("LLM warm-up succeeded for model %s", (llm.model or "").strip())
-
+        # The main and dedupe routes are independent; overlap their round trips.
+        checks = [
+            _warm_up_model_route(
+                raw_model, preflight_model_connection(raw_model, settings=settings)
+            )
+        ]
         if settings.dedupe.model:
-            from strix.report.dedupe import _dedupe_extra_args
-
             dedupe_model = settings.dedupe.model.strip()
-            raw_model = dedupe_model
-            deduper = StrixProvider().get_model(dedupe_model)
-            deduper_extra = _dedupe_extra_args(settings.dedupe)
-            # A dedicated dedupe model may route to another provider, which must
-            # never receive the main endpoint's headers; it has its own
-            # DEDUPE_LLM_EXTRA_HEADERS.
-            deduper_settings = make_model_settings(
-                None,
-                model_name=dedupe_model,
-                request_timeout=llm.timeout,
-                prompt_cache=False,
-                extra_headers=settings.dedupe.extra_headers,
-            )
-            if deduper_extra:
-                merged = {**(deduper_settings.extra_args or {}), **deduper_extra}
-                deduper_settings = deduper_settings.resolve(ModelSettings(extra_args=merged))
-            await asyncio.wait_for(
-                deduper.get_response(
-                    system_instructions="You are a helpful assistant.",
-                    input="Reply with just 'OK'.",
-                    model_settings=deduper_settings,
-                    tools=[],
-                    output_schema=None,
-                    handoffs=[],
-                    tracing=ModelTracing.DISABLED,
-                    previous_response_id=None,
-                    conversation_id=None,
-                    prompt=None,
-                ),
-                timeout=llm.timeout,
-            )
-            logger.info("LLM warm-up succeeded for dedupe model %s", dedupe_model)
+            checks.append(_warm_up_model_route(dedupe_model, _warm_up_dedupe_model(settings)))
+        await asyncio.gather(*checks)
+        logger.info("LLM warm-up succeeded for model %s", (llm.model or "").strip())
 
     except ModelConnectionError:
         logger.debug("Model route warm-up failed", exc_info=True)
@@ -263,51 +283,41 @@ def display_completion_message(args: argparse.Namespace, results_path: Path) ->
     if report_state:
         scan_completed = report_state.run_record.get("status") == "completed"
 
-    completion_text = Text()
-    if scan_completed:
-        completion_text.append("Penetration test completed", style="bold #22c55e")
-    else:
-        completion_text.append("SESSION ENDED", style="bold #eab308")
-
-    target_text = Text()
-    target_text.append("Target", style="dim")
-    target_text.append("  ")
+    panel_parts: list[Text | str | tuple[str, str]] = [
+        ("Penetration test completed", "bold #22c55e")
+        if scan_completed
+        else ("SESSION ENDED", "bold #eab308"),
+        "\n\n",
+        ("Target", "dim"),
+        "  ",
+    ]
     if len(args.targets_info) == 1:
-        target_text.append(args.targets_info[0]["original"], style="bold white")
+        panel_parts.append((args.targets_info[0]["original"], "bold white"))
     else:
-        target_text.append(f"{len(args.targets_info)} targets", style="bold white")
+        panel_parts.append((f"{len(args.targets_info)} targets", "bold white"))
         for target_info in args.targets_info:
-            target_text.append("\n        ")
-            target_text.append(target_info["original"], style="white")
+            panel_parts.extend(["\n        ", (target_info["original"], "white")])
 
     stats_text = build_final_stats_text(report_state)
-
-    panel_parts: list[Text | str] = [completion_text, "\n\n", target_text]
-
     if stats_text.plain:
         panel_parts.extend(["\n", stats_text])
 
-    results_text = Text()
-    results_text.append("\n")
-    results_text.append("Output", style="dim")
-    results_text.append("  ")
-    results_text.append(str(results_path), style="#60a5fa")
-    panel_parts.extend(["\n", results_text])
-
-    view_text = Text()
-    view_text.append("\n")
-    view_text.append("View", style="dim")
-    view_text.append("    ")
-    view_text.append(f"strix view {args.run_name}", style="#22c55e")
-    panel_parts.extend(["\n", view_text])
-
+    panel_parts.extend(
+        [
+            "\n\n",
+            ("Output", "dim"),
+            "  ",
+            (str(results_path), "#60a5fa"),
+            "\n\n",
+            ("View", "dim"),
+            "    ",
+            (f"strix view {args.run_name}", "#22c55e"),
+        ]
+    )
     if not scan_completed:
-        resume_text = Text()
-        resume_text.append("\n")
-        resume_text.append("Resume", style="dim")
-        resume_text.append("  ")
-        resume_text.append(f"strix --resume {args.run_name}", style="#22c55e")
-        panel_parts.extend(["\n", resume_text])
+        panel_parts.extend(
+            ["\n\n", ("Resume", "dim"), "  ", (f"strix --resume {args.run_name}", "#22c55e")]
+        )
 
     panel_content = Text.assemble(*panel_parts)
 
@@ -385,18 +395,73 @@ def _print_model_connection_error(exc: BaseException, model_name: str) -> None:
     console.print()
 
 
+def _warm_up_while_pulling() -> None:
+    """Overlap the model warm-up round trip with the sandbox image pull.
+
+    The pull runs on a daemon thread with plain progress lines instead of a
+    live spinner, so Ctrl-C or a failed warm-up exits straight away and its
+    error prints cleanly: ``stop`` silences the pull before the exception
+    leaves here. A failed pull cancels the warm-up and surfaces at once. The
+    pull starts only once ``warm_up_llm`` first yields, so the model warnings
+    it prints before that come first and an early exit (e.g. an unknown model
+    name) never starts a pull at all.
+    """
+    stop = threading.Event()
+    failures: list[BaseException] = []
+    pulls: list[threading.Thread] = []
+
+    def _pull(loop: asyncio.AbstractEventLoop, warm_up: asyncio.Task[None]) -> None:
+        try:
+            pull_docker_image(stop=stop)
+        except BaseException as exc:  # re-raised on the main thread
+            failures.append(exc)
+            with contextlib.suppress(RuntimeError):  # the loop has already closed
+                loop.call_soon_threadsafe(warm_up.cancel)
+
+    async def _warm_up() -> None:
+        loop = asyncio.get_running_loop()
+        warm_up = asyncio.current_task()
+
+        def _start_pull() -> None:
+            if warm_up is not None and not warm_up.done():
+                pull = threading.Thread(
+                    target=_pull, args=(loop, warm_up), name="strix-image-pull", daemon=True
+                )
+                pull.start()
+                pulls.append(pull)
+
+        loop.call_soon(_start_pull)
+        await warm_up_llm(show_model_warning=True)
+
+    try:
+        asyncio.run(_warm_up())
+    except BaseException:
+        stop.set()
+        if failures:
+            raise failures[0] from None
+        raise
+    if not pulls:
+        # Warm-up never yielded, so the pull never started; run it here.
+        pull_docker_image()
+        return
+    pulls[0].join()
+    if failures:
+        raise failures[0]
+
+
 def _bootstrap_scan(args: argparse.Namespace) -> None:
     """Warm up the model and prepare the run for a non-interactive scan.
 
-    Interactive launches only validate the environment here; the model
-    preflight and run preparation happen inside the TUI so the interface
-    paints immediately instead of waiting on a model round trip.
+    Interactive launches only validate the environment and pull the image
+    here; the model preflight and run preparation happen inside the TUI so
+    the interface paints immediately instead of waiting on a model round trip.
     """
     validate_environment()
     if not args.non_interactive:
+        pull_docker_image()
         return
     try:
-        asyncio.run(warm_up_llm(show_model_warning=True))
+        _warm_up_while_pulling()
     except ModelConnectionError as exc:
         _print_model_connection_error(exc, exc.model_name)
         sys.exit(1)
@@ -439,11 +504,12 @@ def main() -> None:
         sys.exit(0)
 
     check_docker_installed()
-    pull_docker_image()
 
     # In setup mode the TUI collects the target, then runs prepare_run(),
     # warm-up, and telemetry itself once the user starts the scan.
-    if not args.needs_setup:
+    if args.needs_setup:
+        pull_docker_image()
+    else:
         _bootstrap_scan(args)
 
     from strix.report.state import get_global_report_state
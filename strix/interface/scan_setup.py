@@ -18,7 +18,7 @@ from strix.config import Settings, codex, load_settings
 from strix.core.paths import run_dir_for
 from strix.interface.utils import (
     assign_workspace_subdirs,
-    clone_repository,
+    clone_repositories,
     collect_local_sources,
     dedupe_local_targets,
     derive_local_base_name,
@@ -101,31 +101,41 @@ def build_targets_info(args: argparse.Namespace) -> None:
 
     Raises :class:`ValueError` with a user-facing message on any bad input so
     callers can surface it via ``parser.error`` (CLI) or a console panel (home
-    page).
+    page). Every target is checked first, so one error lists all bad inputs.
     """
     args.targets_info = []
     targets = list(args.target or [])
     for target_list_path in args.target_list or []:
         targets.extend(read_target_list_file(target_list_path))
 
+    errors: list[str] = []
     for target in targets:
         try:
             target_type, target_dict = infer_target_type(target)
         except ValueError as e:
-            raise ValueError(f"Invalid target '{target}': {e}") from None
-
-        if target_type == "local_code":
-            display_target = target_dict.get("target_path", target)
-        else:
-            display_target = target
+            errors.append(f"Invalid target '{target}': {e}")
+            continue
 
         if target_type == "api_spec":
-            _resolve_api_spec(target, target_dict)
+            try:
+                _resolve_api_spec(target, target_dict)
+            except ValueError as e:
+                errors.append(str(e))
+                continue
 
         args.targets_info.append(
-            {"type": target_type, "details": target_dict, "original": display_target}
+            {
+                "type": target_type,
+                "details": target_dict,
+                "original": target_dict.get("target_path", target)
+                if target_type == "local_code"
+                else target,
+            }
         )
 
+    if errors:
+        raise ValueError("\n\n".join(errors))
+
     args.targets_info = dedupe_local_targets(args.targets_info)
 
     assign_workspace_subdirs(args.targets_info)
@@ -172,12 +182,13 @@ def prepare_run(args: argparse.Namespace) -> None:
     if args.resume:
         return
 
-    for target_info in args.targets_info:
-        if target_info["type"] == "repository":
-            repo_url = target_info["details"]["target_repo"]
-            dest_name = target_info["details"].get("workspace_subdir")
-            cloned_path = clone_repository(repo_url, args.run_name, dest_name)
-            target_info["details"]["cloned_repo_path"] = cloned_path
+    repo_targets = [t for t in args.targets_info if t["type"] == "repository"]
+    cloned_paths = clone_repositories(
+        [(t["details"]["target_repo"], t["details"].get("workspace_subdir")) for t in repo_targets],
+        args.run_name,
+    )
+    for target_info, cloned_path in zip(repo_targets, cloned_paths, strict=True):
+        target_info["details"]["cloned_repo_path"] = cloned_path
 
     args.local_sources = collect_local_sources(args.targets_info)
     args.local_sources.extend(stage_api_specs(args.targets_info, args.run_name))
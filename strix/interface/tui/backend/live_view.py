@@ -112,6 +112,9 @@ class TuiLiveView(BaseLiveView):
         if not isinstance(event_id, str) or not event_id:
             return
         self._event_cursor += 1
+        # Re-inserting keeps the dict ordered by change cursor, so polls only
+        # walk the entries changed since their cursor.
+        self._event_change_cursor.pop(event_id, None)
         self._event_change_cursor[event_id] = self._event_cursor
 
     def event_snapshot(self, *, limit: int | None = None) -> tuple[int, list[dict[str, Any]]]:
@@ -121,16 +124,14 @@ class TuiLiveView(BaseLiveView):
     def event_changes_since(self, cursor: int) -> tuple[int, list[dict[str, Any]]]:
         if cursor < 0 or cursor > self._event_cursor:
             raise ValueError("event cursor is outside the available history")
-        changed_ids = sorted(
-            (
-                (change_cursor, event_id)
-                for event_id, change_cursor in self._event_change_cursor.items()
-                if change_cursor > cursor
-            )
-        )
+        changed_ids: list[str] = []
+        for event_id, change_cursor in reversed(self._event_change_cursor.items()):
+            if change_cursor <= cursor:
+                break
+            changed_ids.append(event_id)
         changed = [
             self._events_by_id[event_id]
-            for _change_cursor, event_id in changed_ids
+            for event_id in reversed(changed_ids)
             if event_id in self._events_by_id
         ]
         return self._event_cursor, changed
@@ -16,15 +16,15 @@ MAX_TERMINAL_EVENTS = 5_000
 MAX_TERMINAL_VULNERABILITIES = 1_000
 STATE_TARGET_BYTES = 48 * 1024
 TERMINAL_ESCAPE_RE = re.compile(r"\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[@-_][0-?]*[ -/]*[@-~]")
+# Escape sequences first, then any other C0/DEL/C1 control except tab and
+# newline, so one left-to-right pass strips both.
+_TERMINAL_UNSAFE_RE = re.compile(
+    rf"{TERMINAL_ESCAPE_RE.pattern}|[\x00-\x08\x0b-\x1f\x7f-\x9f]",
+)
 
 
 def sanitize_terminal_text(value: str) -> str:
-    without_escapes = TERMINAL_ESCAPE_RE.sub("", value)
-    return "".join(
-        character
-        for character in without_escapes
-        if character in "\n\t" or (ord(character) >= 32 and not 127 <= ord(character) <= 159)
-    )
+    return _TERMINAL_UNSAFE_RE.sub("", value)
 
 
 def terminal_projection(  # noqa: PLR0911
@@ -47,8 +47,11 @@ func renderAgentGraphTool(name string, args map[string]any, result any) string {
 		if summary := StringValue(args["result_summary"]); summary != "" {
 			b.WriteString("\n  " + lipgloss.NewStyle().Bold(true).Render(summary))
 			if findings, ok := args["findings"].([]any); ok {
+				// One Render per finding: rendering the joined list as a single
+				// multi-line block would pad every line to the widest one.
 				for _, f := range findings {
-					b.WriteString("\n  • " + Dim().Render(StringValue(f)))
+					b.WriteString("\n  • ")
+					b.WriteString(Dim().Render(StringValue(f)))
 				}
 			}
 		} else {
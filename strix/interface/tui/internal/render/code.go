@@ -3,6 +3,7 @@ package render
 import (
 	"path/filepath"
 	"strings"
+	"sync"
 
 	"github.com/alecthomas/chroma/v2"
 	"github.com/alecthomas/chroma/v2/formatters"
@@ -10,6 +11,35 @@ import (
 	"github.com/alecthomas/chroma/v2/styles"
 )
 
+// The highlighter's style and formatter are fixed, so resolve them from
+// chroma's registries once instead of on every highlighted block.
+var (
+	codeStyle     = styles.Get("native")
+	codeFormatter = formatters.Get("terminal256")
+)
+
+// Highlighted output is memoized per (language, code): the app's block cache is
+// keyed on width too, so a terminal resize or an expand toggle re-renders every
+// event, and tokenizing is the bulk of that work. Only blocks up to
+// highlightCacheMaxCode bytes are kept, and the cache resets once it holds
+// highlightCacheEntries of them, which bounds its memory.
+const (
+	highlightCacheEntries = 256
+	highlightCacheMaxCode = 8 << 10
+)
+
+// highlightMaxCode caps what is tokenized at all. Larger blocks (pasted dumps,
+// generated payloads) are shown in full but uncolored: tokenizing them costs
+// more than the colors are worth and would repeat on every re-render.
+const highlightMaxCode = 64 << 10
+
+type highlightKey struct{ language, code string }
+
+var (
+	highlightMu    sync.Mutex
+	highlightCache = map[highlightKey]string{}
+)
+
 // HighlightCode ports the Python renderers' pygments highlighting: colorize
 // code for the terminal using the "native" style, falling back to the plain
 // text when the language is unknown or the highlighter fails.
@@ -17,41 +47,125 @@ func HighlightCode(code, language string) string {
 	if strings.TrimSpace(code) == "" {
 		return code
 	}
+	if len(code) > highlightMaxCode {
+		return Col(Text).Render(code)
+	}
+	if len(code) > highlightCacheMaxCode {
+		return highlightCode(code, language)
+	}
+	key := highlightKey{language, code}
+	highlightMu.Lock()
+	out, ok := highlightCache[key]
+	highlightMu.Unlock()
+	if ok {
+		return out
+	}
+	out = highlightCode(code, language)
+	highlightMu.Lock()
+	if len(highlightCache) >= highlightCacheEntries {
+		clear(highlightCache)
+	}
+	highlightCache[key] = out
+	highlightMu.Unlock()
+	return out
+}
+
+const lexerByLanguageEntries = 64
+
+// lexerByLanguage memoizes the coalesced lexer per requested language,
+// including misses: lexers.Get falls back to glob-matching every registered
+// lexer's filenames when a name is unknown (e.g. a "text" fence). Fence
+// languages are model-written, so the memo is bounded like the others.
+var lexerByLanguage = newBoundedCache[string, chroma.Lexer](lexerByLanguageEntries)
+
+func lexerForLanguage(language string) chroma.Lexer {
+	if lexer, ok := lexerByLanguage.get(language); ok {
+		return lexer
+	}
+	var lexer chroma.Lexer
+	if found := lexers.Get(language); found != nil {
+		lexer = chroma.Coalesce(found)
+	}
+	lexerByLanguage.put(language, lexer)
+	return lexer
+}
+
+func highlightCode(code, language string) string {
 	var lexer chroma.Lexer
 	if language != "" {
-		lexer = lexers.Get(language)
+		lexer = lexerForLanguage(language)
 	}
 	if lexer == nil {
-		lexer = lexers.Analyse(code)
+		if found := lexers.Analyse(code); found != nil {
+			lexer = chroma.Coalesce(found)
+		}
 	}
 	if lexer == nil {
 		return Col(Text).Render(code)
 	}
-	lexer = chroma.Coalesce(lexer)
-	style := styles.Get("native")
-	formatter := formatters.Get("terminal256")
 	iterator, err := lexer.Tokenise(nil, code)
 	if err != nil {
 		return Col(Text).Render(code)
 	}
 	var out strings.Builder
-	if err := formatter.Format(&out, style, iterator); err != nil {
+	if err := codeFormatter.Format(&out, codeStyle, iterator); err != nil {
 		return Col(Text).Render(code)
 	}
 	return strings.TrimSuffix(out.String(), "\n")
 }
 
+// boundedCache is a mutex-guarded memo that resets once it holds limit
+// entries. Its keys come from tool output and model text, so like the
+// highlight cache it must not grow for the whole session.
+type boundedCache[K comparable, V any] struct {
+	mu      sync.Mutex
+	limit   int
+	entries map[K]V
+}
+
+func newBoundedCache[K comparable, V any](limit int) *boundedCache[K, V] {
+	return &boundedCache[K, V]{limit: limit, entries: make(map[K]V)}
+}
+
+func (c *boundedCache[K, V]) get(key K) (V, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	value, ok := c.entries[key]
+	return value, ok
+}
+
+func (c *boundedCache[K, V]) put(key K, value V) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if len(c.entries) >= c.limit {
+		clear(c.entries)
+	}
+	c.entries[key] = value
+}
+
+const languageByBaseEntries = 1024
+
+// languageByBase memoizes languageForPath per file base name: lexers.Match
+// glob-matches every registered lexer, and the same files are re-rendered on
+// every repaint of a patch.
+var languageByBase = newBoundedCache[string, string](languageByBaseEntries)
+
 // languageForPath resolves a chroma language name from a file path, returning
 // "" when the extension is unknown.
 func languageForPath(path string) string {
 	if path == "" {
 		return ""
 	}
-	lexer := lexers.Match(filepath.Base(path))
-	if lexer == nil {
-		return ""
+	base := filepath.Base(path)
+	if name, ok := languageByBase.get(base); ok {
+		return name
+	}
+	name := ""
+	if lexer := lexers.Match(base); lexer != nil {
+		name = lexer.Config().Name
 	}
-	return lexer.Config().Name
+	languageByBase.put(base, name)
+	return name
 }
 
 // ParseFencedCode ports parse_fenced_code: strip a surrounding ``` fence and
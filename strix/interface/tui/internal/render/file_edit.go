@@ -2,6 +2,7 @@ package render
 
 import (
 	"strings"
+	"sync"
 )
 
 // ---------------------------------------------------------------------------
@@ -83,12 +84,23 @@ func parsePatchOperations(patch string) []patchOp {
 
 var opLabel = map[string]string{"add": "create", "update": "edit", "delete": "delete"}
 
+// opHeaders holds the styled "◇ label" prefix per operation kind (key "" is the
+// fallback). They never change, so they are rendered once on first use.
+var opHeaders = sync.OnceValue(func() map[string]string {
+	icon := Col(Emerald).Render("◇ ")
+	headers := map[string]string{"": icon + Dim().Render("file")}
+	for kind, label := range opLabel {
+		headers[kind] = icon + Dim().Render(label)
+	}
+	return headers
+})
+
 func renderPatchOperation(b *strings.Builder, op patchOp) {
-	label := opLabel[op.kind]
-	if label == "" {
-		label = "file"
+	header, ok := opHeaders()[op.kind]
+	if !ok {
+		header = opHeaders()[""]
 	}
-	b.WriteString(Col(Emerald).Render("◇ ") + Dim().Render(label))
+	b.WriteString(header)
 	if op.path != "" {
 		p := op.path
 		if len(p) > 60 {
@@ -98,11 +110,15 @@ func renderPatchOperation(b *strings.Builder, op patchOp) {
 	}
 	lang := languageForPath(op.path)
 	if op.kind == "update" {
+		removed := "\n" + Col(Red).Render("-") + " "
 		for _, line := range highlightLines(op.old, lang) {
-			b.WriteString("\n" + Col(Red).Render("-") + " " + line)
+			b.WriteString(removed)
+			b.WriteString(line)
 		}
+		added := "\n" + Col(Green).Render("+") + " "
 		for _, line := range highlightLines(op.new, lang) {
-			b.WriteString("\n" + Col(Green).Render("+") + " " + line)
+			b.WriteString(added)
+			b.WriteString(line)
 		}
 	} else if op.kind == "add" && len(op.new) > 0 {
 		b.WriteString("\n" + HighlightCode(strings.Join(op.new, "\n"), lang))
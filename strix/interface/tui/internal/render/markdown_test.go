@@ -1,6 +1,7 @@
 package render
 
 import (
+	"fmt"
 	"strings"
 	"testing"
 
@@ -101,3 +102,67 @@ func TestInlineFormatStillStylesRealEmphasis(t *testing.T) {
 		}
 	}
 }
+
+func TestLanguageForPathIsStableAcrossCachedLookups(t *testing.T) {
+	for range 2 {
+		if got := languageForPath("src/app/main.py"); got != "Python" {
+			t.Fatalf("languageForPath(main.py) = %q, want Python", got)
+		}
+		if got := languageForPath("notes.unknownext"); got != "" {
+			t.Fatalf("languageForPath(unknown) = %q, want empty", got)
+		}
+	}
+}
+
+func TestHighlightCodeReusesCachedOutput(t *testing.T) {
+	code := "print('cached')"
+	first := HighlightCode(code, "python")
+	highlightMu.Lock()
+	cached, ok := highlightCache[highlightKey{"python", code}]
+	highlightMu.Unlock()
+	if !ok || cached != first {
+		t.Fatal("highlighted block was not cached")
+	}
+	if again := HighlightCode(code, "python"); again != first {
+		t.Fatalf("cached highlight differs: %q vs %q", again, first)
+	}
+}
+
+func TestHighlightCodeLeavesOversizedBlocksUncolored(t *testing.T) {
+	// Equal-width lines and no trailing newline, so lipgloss adds no padding.
+	code := strings.Repeat("x = 1\n", highlightMaxCode/6+1) + "x = 1"
+	out := HighlightCode(code, "python")
+	if ansi.Strip(out) != code {
+		t.Fatal("oversized block text was altered")
+	}
+}
+
+func TestLanguageForPathCacheIsBounded(t *testing.T) {
+	for i := range languageByBaseEntries + 10 {
+		languageForPath(fmt.Sprintf("file%d.py", i))
+	}
+	languageByBase.mu.Lock()
+	size := len(languageByBase.entries)
+	languageByBase.mu.Unlock()
+	if size > languageByBaseEntries {
+		t.Fatalf("languageByBase holds %d entries, limit %d", size, languageByBaseEntries)
+	}
+	if got := languageForPath("main.go"); got != "Go" {
+		t.Fatalf("languageForPath(main.go) = %q after reset, want Go", got)
+	}
+}
+
+func TestLexerForLanguageCacheIsBounded(t *testing.T) {
+	for i := range lexerByLanguageEntries + 10 {
+		lexerForLanguage(fmt.Sprintf("made-up-language-%d", i))
+	}
+	lexerByLanguage.mu.Lock()
+	size := len(lexerByLanguage.entries)
+	lexerByLanguage.mu.Unlock()
+	if size > lexerByLanguageEntries {
+		t.Fatalf("lexerByLanguage holds %d entries, limit %d", size, lexerByLanguageEntries)
+	}
+	if lexerForLanguage("python") == nil {
+		t.Fatal("python lexer not resolved after reset")
+	}
+}
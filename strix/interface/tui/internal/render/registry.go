@@ -45,10 +45,9 @@ func renderGenericTool(name string, args map[string]any, result any, status stri
 func Tool(data map[string]any) string {
 	name := StringValue(data["tool_name"])
 	status := StringValue(data["status"])
+	// Renderers only read args, and reads from a nil map yield zero values, so
+	// a missing payload needs no placeholder allocation.
 	args, _ := data["args"].(map[string]any)
-	if args == nil {
-		args = map[string]any{}
-	}
 	result := data["result"]
 
 	switch name {
@@ -43,9 +43,13 @@ var (
 	InfoBlue  = lipgloss.Color("#60a5fa")
 )
 
+// dimStyle backs Dim(), the most used style in the renderers. lipgloss styles
+// are immutable values, so handing out the same one is safe.
+var dimStyle = lipgloss.NewStyle().Faint(true)
+
 // Style helpers. Col() foreground; Dim() Rich "dim" (faint attribute).
 func Col(c lipgloss.Color) lipgloss.Style { return lipgloss.NewStyle().Foreground(c) }
-func Dim() lipgloss.Style                 { return lipgloss.NewStyle().Faint(true) }
+func Dim() lipgloss.Style                 { return dimStyle }
 func Bold(c lipgloss.Color) lipgloss.Style {
 	return lipgloss.NewStyle().Bold(true).Foreground(c)
 }
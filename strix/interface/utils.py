@@ -1,3 +1,5 @@
+import errno
+import functools
 import ipaddress
 import json
 import logging
@@ -5,17 +7,19 @@ import os
 import re
 import secrets
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
-import docker
 import requests
-from docker.errors import DockerException, ImageNotFound
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -26,16 +30,26 @@ from strix.utils.api_spec import detect_spec_format
 
 logger = logging.getLogger(__name__)
 
+_MAX_PARALLEL_CLONES = 8
+
+# docker.from_env() negotiates the API version with the daemon, so the client
+# is built once per process and reused by later checks.
+_docker_client: Any = None
+
+
+_SEVERITY_ORDER = ("critical", "high", "medium", "low", "info")
+
+_SEVERITY_COLORS = {
+    "critical": "#dc2626",
+    "high": "#ea580c",
+    "medium": "#d97706",
+    "low": "#65a30d",
+    "info": "#0284c7",
+}
+
 
 def get_severity_color(severity: str) -> str:
-    severity_colors = {
-        "critical": "#dc2626",
-        "high": "#ea580c",
-        "medium": "#d97706",
-        "low": "#65a30d",
-        "info": "#0284c7",
-    }
-    return severity_colors.get(severity, "#6b7280")
+    return _SEVERITY_COLORS.get(severity, "#6b7280")
 
 
 def get_cvss_color(cvss_score: float) -> str:
@@ -50,6 +64,9 @@ def get_cvss_color(cvss_score: float) -> str:
     return "#6b7280"
 
 
+# The live stats panel re-formats the same counts on every poll between model
+# responses, so recent results are kept.
+@functools.lru_cache(maxsize=1024)
 def format_token_count(count: float | None) -> str:
     value = int(count or 0)
     if value >= 1_000_000:
@@ -207,42 +224,43 @@ def format_vulnerability_report(report: dict[str, Any]) -> Text:  # noqa: PLR091
     return text
 
 
-def _build_vulnerability_stats(stats_text: Text, report_state: Any) -> None:
-    vuln_count = len(report_state.vulnerability_reports)
+def _severity_breakdown(reports: list[dict[str, Any]]) -> list[tuple[str, str]]:
+    """``CRITICAL: n | HIGH: n | ...`` segments for the severities present."""
+    severity_counts = Counter(report.get("severity", "").lower() for report in reports)
+
+    segments: list[tuple[str, str]] = []
+    for severity in _SEVERITY_ORDER:
+        count = severity_counts[severity]
+        if count > 0:
+            if segments:
+                segments.append((" | ", "dim white"))
+            severity_color = _SEVERITY_COLORS[severity]
+            segments += [
+                (f"{severity.upper()}: ", severity_color),
+                (str(count), f"bold {severity_color}"),
+            ]
+    return segments
+
+
+def _vulnerability_stats(report_state: Any) -> list[tuple[str, str]]:
+    reports = report_state.vulnerability_reports
+    vuln_count = len(reports)
 
     if vuln_count > 0:
-        severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0, "info": 0}
-        for report in report_state.vulnerability_reports:
-            severity = report.get("severity", "").lower()
-            if severity in severity_counts:
-                severity_counts[severity] += 1
-
-        stats_text.append("Vulnerabilities  ", style="bold red")
-
-        severity_parts = []
-        for severity in ["critical", "high", "medium", "low", "info"]:
-            count = severity_counts[severity]
-            if count > 0:
-                severity_color = get_severity_color(severity)
-                severity_text = Text()
-                severity_text.append(f"{severity.upper()}: ", style=severity_color)
-                severity_text.append(str(count), style=f"bold {severity_color}")
-                severity_parts.append(severity_text)
-
-        for i, part in enumerate(severity_parts):
-            stats_text.append(part)
-            if i < len(severity_parts) - 1:
-                stats_text.append(" | ", style="dim white")
-
-        stats_text.append(" (Total: ", style="dim white")
-        stats_text.append(str(vuln_count), style="bold yellow")
-        stats_text.append(")", style="dim white")
-        stats_text.append("\n")
-    else:
-        stats_text.append("Vulnerabilities  ", style="bold #22c55e")
-        stats_text.append("0", style="bold white")
-        stats_text.append(" (No exploitable vulnerabilities detected)", style="dim green")
-        stats_text.append("\n")
+        return [
+            ("Vulnerabilities  ", "bold red"),
+            *_severity_breakdown(reports),
+            (" (Total: ", "dim white"),
+            (str(vuln_count), "bold yellow"),
+            (")", "dim white"),
+            ("\n", ""),
+        ]
+    return [
+        ("Vulnerabilities  ", "bold #22c55e"),
+        ("0", "bold white"),
+        (" (No exploitable vulnerabilities detected)", "dim green"),
+        ("\n", ""),
+    ]
 
 
 def _llm_usage(report_state: Any) -> dict[str, Any]:
@@ -296,112 +314,78 @@ def has_model_response(report_state: Any) -> bool:
     return bool(usage) and _int_stat(usage, "requests") > 0
 
 
-def _build_llm_usage_stats(
-    stats_text: Text,
-    report_state: Any,
-    *,
-    live: bool = False,
-) -> None:
+def _llm_usage_stats(report_state: Any, *, live: bool = False) -> list[tuple[str, str]]:
     subscription = is_subscription_run(report_state)
     usage = _llm_usage(report_state)
     if not usage or _int_stat(usage, "requests") <= 0:
-        stats_text.append("\n")
-        stats_text.append("Cost ", style="dim")
-        if subscription:
-            stats_text.append("$0.00 ", style="#22c55e")
-            stats_text.append("(subscription) ", style="dim")
-        else:
-            stats_text.append("$0.0000 ", style="#fbbf24")
-        stats_text.append("· ", style="dim white")
-        stats_text.append("Tokens ", style="dim")
-        stats_text.append("0", style="white")
-        return
+        return [
+            ("\n", ""),
+            ("Cost ", "dim"),
+            *(
+                [("$0.00 ", "#22c55e"), ("(subscription) ", "dim")]
+                if subscription
+                else [("$0.0000 ", "#fbbf24")]
+            ),
+            ("· ", "dim white"),
+            ("Tokens ", "dim"),
+            ("0", "white"),
+        ]
 
     input_tokens = _int_stat(usage, "input_tokens")
     output_tokens = _int_stat(usage, "output_tokens")
     cached_tokens = _detail_value(usage, "input_tokens_details", "cached_tokens")
     cost = _float_stat(usage, "cost")
 
-    stats_text.append("\n")
-    stats_text.append("Input Tokens ", style="dim")
-    stats_text.append(format_token_count(input_tokens), style="white")
-
+    segments = [
+        ("\n", ""),
+        ("Input Tokens ", "dim"),
+        (format_token_count(input_tokens), "white"),
+    ]
     if live or cached_tokens > 0:
-        stats_text.append("  ·  ", style="dim white")
-        stats_text.append("Cached Tokens ", style="dim")
-        stats_text.append(format_token_count(cached_tokens), style="white")
-
-    separator = "\n" if live else "  ·  "
-    stats_text.append(separator, style="dim white")
-    stats_text.append("Output Tokens ", style="dim")
-    stats_text.append(format_token_count(output_tokens), style="white")
-
+        segments += [
+            ("  ·  ", "dim white"),
+            ("Cached Tokens ", "dim"),
+            (format_token_count(cached_tokens), "white"),
+        ]
+    segments += [
+        ("\n" if live else "  ·  ", "dim white"),
+        ("Output Tokens ", "dim"),
+        (format_token_count(output_tokens), "white"),
+    ]
     if subscription:
-        stats_text.append("  ·  ", style="dim white")
-        stats_text.append("Cost ", style="dim")
-        stats_text.append("$0.00", style="#22c55e")
-        stats_text.append(" (subscription)", style="dim")
+        segments += [
+            ("  ·  ", "dim white"),
+            ("Cost ", "dim"),
+            ("$0.00", "#22c55e"),
+            (" (subscription)", "dim"),
+        ]
     elif live or cost > 0:
-        stats_text.append("  ·  ", style="dim white")
-        stats_text.append("Cost ", style="dim")
-        stats_text.append(f"${cost:.4f}", style="#fbbf24")
+        segments += [("  ·  ", "dim white"), ("Cost ", "dim"), (f"${cost:.4f}", "#fbbf24")]
+    return segments
 
 
 def build_final_stats_text(report_state: Any) -> Text:
-    stats_text = Text()
     if not report_state:
-        return stats_text
-
-    _build_vulnerability_stats(stats_text, report_state)
-    _build_llm_usage_stats(stats_text, report_state)
-
-    return stats_text
+        return Text()
+    return Text.assemble(*_vulnerability_stats(report_state), *_llm_usage_stats(report_state))
 
 
 def build_live_stats_text(report_state: Any) -> Text:
-    stats_text = Text()
     if not report_state:
-        return stats_text
+        return Text()
 
     model = load_settings().llm.model or "unknown"
-    stats_text.append("Model ", style="dim")
-    stats_text.append(str(model), style="white")
+    segments = [("Model ", "dim"), (str(model), "white")]
     if is_subscription_run(report_state):
-        stats_text.append("  ·  ", style="dim white")
-        stats_text.append("ChatGPT subscription", style="#22c55e")
-    stats_text.append("\n")
+        segments += [("  ·  ", "dim white"), ("ChatGPT subscription", "#22c55e")]
 
-    vuln_count = len(report_state.vulnerability_reports)
-    stats_text.append("Vulnerabilities ", style="dim")
-    stats_text.append(f"{vuln_count}", style="white")
-    stats_text.append("\n")
+    reports = report_state.vulnerability_reports
+    vuln_count = len(reports)
+    segments += [("\n", ""), ("Vulnerabilities ", "dim"), (f"{vuln_count}", "white"), ("\n", "")]
     if vuln_count > 0:
-        severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0, "info": 0}
-        for report in report_state.vulnerability_reports:
-            severity = report.get("severity", "").lower()
-            if severity in severity_counts:
-                severity_counts[severity] += 1
-
-        severity_parts = []
-        for severity in ["critical", "high", "medium", "low", "info"]:
-            count = severity_counts[severity]
-            if count > 0:
-                severity_color = get_severity_color(severity)
-                severity_text = Text()
-                severity_text.append(f"{severity.upper()}: ", style=severity_color)
-                severity_text.append(str(count), style=f"bold {severity_color}")
-                severity_parts.append(severity_text)
-
-        for i, part in enumerate(severity_parts):
-            stats_text.append(part)
-            if i < len(severity_parts) - 1:
-                stats_text.append(" | ", style="dim white")
+        segments += [*_severity_breakdown(reports), ("\n", "")]
 
-        stats_text.append("\n")
-
-    _build_llm_usage_stats(stats_text, report_state, live=True)
-
-    return stats_text
+    return Text.assemble(*segments, *_llm_usage_stats(report_state, live=True))
 
 
 def build_tui_stats_text(report_state: Any) -> Text:
@@ -417,12 +401,10 @@ def build_tui_stats_text(report_state: Any) -> Text:
         stats_text.append("ChatGPT subscription", style="#22c55e")
 
     usage = _llm_usage(report_state)
-    if usage and _int_stat(usage, "total_tokens") > 0:
+    total_tokens = _int_stat(usage, "total_tokens") if usage else 0
+    if total_tokens > 0:
         stats_text.append("\n")
-        stats_text.append(
-            f"{format_token_count(_int_stat(usage, 'total_tokens'))} tokens",
-            style="white",
-        )
+        stats_text.append(f"{format_token_count(total_tokens)} tokens", style="white")
         cost = _float_stat(usage, "cost")
         if subscription:
             stats_text.append(" · ", style="white")
@@ -440,9 +422,12 @@ def build_tui_stats_text(report_state: Any) -> Text:
     return stats_text
 
 
+_SLUG_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _slugify_for_run_name(text: str, max_length: int = 32) -> str:
     text = text.lower().strip()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
+    text = _SLUG_SEPARATOR_RE.sub("-", text)
     text = text.strip("-")
     if len(text) > max_length:
         text = text[:max_length].rstrip("-")
@@ -1099,6 +1084,13 @@ def resolve_diff_scope_context(
     )
 
 
+# stat() errors that Path.exists() reports as "no such path" rather than raising.
+_ABSENT_PATH_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+
+# SSH (scp-style) and git-protocol URLs are repositories without any probing.
+_GIT_URL_PREFIXES = ("git@", "git://")
+
+
 def _is_http_git_repo(url: str) -> bool:
     check_url = f"{url.rstrip('/')}/info/refs?service=git-upload-pack"
     try:
@@ -1110,16 +1102,29 @@ def _is_http_git_repo(url: str) -> bool:
         return False
 
 
+def _path_mode(path: Path) -> int | None:
+    """``st_mode`` of ``path``, or None when it does not exist.
+
+    One stat answers both "exists" and "is a directory". Like ``Path.exists()``,
+    a path that can't name a file (an embedded NUL byte) counts as absent.
+    """
+    try:
+        return path.stat().st_mode
+    except OSError as e:
+        if e.errno not in _ABSENT_PATH_ERRNOS:
+            raise
+        return None
+    except ValueError:
+        return None
+
+
 def infer_target_type(target: str) -> tuple[str, dict[str, str]]:  # noqa: PLR0911
     if not target or not isinstance(target, str):
         raise ValueError("Target must be a non-empty string")
 
     target = target.strip()
 
-    if target.startswith("git@"):
-        return "repository", {"target_repo": target}
-
-    if target.startswith("git://"):
+    if target.startswith(_GIT_URL_PREFIXES):
         return "repository", {"target_repo": target}
 
     parsed = urlparse(target)
@@ -1162,8 +1167,9 @@ def infer_target_type(target: str) -> tuple[str, dict[str, str]]:  # noqa: PLR09
 
     path = Path(target).expanduser()
     try:
-        if path.exists():
-            if path.is_dir():
+        mode = _path_mode(path)
+        if mode is not None:
+            if stat.S_ISDIR(mode):
                 check_mountable_dir(path)
                 return "local_code", {"target_path": str(path.resolve())}
             spec_format = detect_spec_format(path)
@@ -1232,8 +1238,11 @@ def read_target_list_file(path_str: str) -> list[str]:
     return targets
 
 
+_UNSAFE_NAME_CHAR_RE = re.compile(r"[^A-Za-z0-9._-]")
+
+
 def sanitize_name(name: str) -> str:
-    sanitized = re.sub(r"[^A-Za-z0-9._-]", "-", name.strip())
+    sanitized = _UNSAFE_NAME_CHAR_RE.sub("-", name.strip())
     return sanitized or "target"
 
 
@@ -1261,21 +1270,22 @@ def derive_local_base_name(path_str: str) -> str:
     return sanitize_name(base or "workspace")
 
 
+# Target types that get a /workspace subdirectory, and how each names it.
+_WORKSPACE_NAME_DERIVERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "repository": lambda details: derive_repo_base_name(details["target_repo"]),
+    "local_code": lambda details: derive_local_base_name(details.get("target_path", "local")),
+}
+
+
 def assign_workspace_subdirs(targets_info: list[dict[str, Any]]) -> None:
     name_counts: dict[str, int] = {}
 
     for target in targets_info:
-        target_type = target["type"]
-        details = target["details"]
-
-        base_name: str | None = None
-        if target_type == "repository":
-            base_name = derive_repo_base_name(details["target_repo"])
-        elif target_type == "local_code":
-            base_name = derive_local_base_name(details.get("target_path", "local"))
-
-        if base_name is None:
+        derive = _WORKSPACE_NAME_DERIVERS.get(target["type"])
+        if derive is None:
             continue
+        details = target["details"]
+        base_name = derive(details)
 
         count = name_counts.get(base_name, 0) + 1
         name_counts[base_name] = count
@@ -1531,16 +1541,53 @@ def stage_api_specs(targets_info: list[dict[str, Any]], run_name: str) -> list[d
     ]
 
 
-def clone_repository(repo_url: str, run_name: str, dest_name: str | None = None) -> str:
-    console = Console()
+@functools.lru_cache(maxsize=1)
+def _git_executable() -> str | None:
+    return shutil.which("git")
+
 
-    git_executable = shutil.which("git")
+def clone_repositories(repos: list[tuple[str, str | None]], run_name: str) -> list[str]:
+    """Clone ``(repo_url, dest_name)`` pairs concurrently; paths keep input order.
+
+    Each clone is an independent network-bound ``git clone``, so wall time is
+    the slowest clone rather than the sum. One spinner covers the batch.
+    Concurrent clones can't share the terminal for credential prompts, so they
+    run with prompting disabled and a missing credential fails the clone; a
+    single repository is cloned on its own and may still prompt.
+    """
+    if not repos:
+        return []
+    git_executable = _git_executable()
     if git_executable is None:
         raise FileNotFoundError("Git executable not found in PATH")
 
     temp_dir = Path(tempfile.gettempdir()) / "strix_repos" / run_name
     temp_dir.mkdir(parents=True, exist_ok=True)
 
+    if len(repos) == 1:
+        repo_url, dest_name = repos[0]
+        with Console().status(f"[bold cyan]Cloning repository {repo_url}...", spinner="dots"):
+            return [_clone_into(git_executable, repo_url, temp_dir, dest_name)]
+
+    env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+    with (
+        Console().status(f"[bold cyan]Cloning {len(repos)} repositories...", spinner="dots"),
+        ThreadPoolExecutor(max_workers=min(len(repos), _MAX_PARALLEL_CLONES)) as pool,
+    ):
+        futures = [
+            pool.submit(_clone_into, git_executable, repo_url, temp_dir, dest_name, env)
+            for repo_url, dest_name in repos
+        ]
+        return [future.result() for future in futures]
+
+
+def _clone_into(
+    git_executable: str,
+    repo_url: str,
+    temp_dir: Path,
+    dest_name: str | None,
+    env: dict[str, str] | None = None,
+) -> str:
     if dest_name:
         repo_name = dest_name
     else:
@@ -1552,18 +1599,18 @@ def clone_repository(repo_url: str, run_name: str, dest_name: str | None = None)
         shutil.rmtree(clone_path)
 
     try:
-        with console.status(f"[bold cyan]Cloning repository {repo_url}...", spinner="dots"):
-            subprocess.run(  # noqa: S603
-                [
-                    git_executable,
-                    "clone",
-                    repo_url,
-                    str(clone_path),
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+        subprocess.run(  # noqa: S603
+            [
+                git_executable,
+                "clone",
+                repo_url,
+                str(clone_path),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
 
         return str(clone_path.absolute())
 
@@ -1578,8 +1625,15 @@ def clone_repository(repo_url: str, run_name: str, dest_name: str | None = None)
 
 
 def check_docker_connection() -> Any:
+    global _docker_client  # noqa: PLW0603
+    if _docker_client is not None:
+        return _docker_client
+
+    import docker
+    from docker.errors import DockerException
+
     try:
-        return docker.from_env()
+        _docker_client = docker.from_env()
     except DockerException:
         console = Console()
         error_text = Text()
@@ -1600,9 +1654,12 @@ def check_docker_connection() -> Any:
         )
         console.print("\n", panel, "\n")
         raise RuntimeError("Docker not available") from None
+    return _docker_client
 
 
 def image_exists(client: Any, image_name: str) -> bool:
+    from docker.errors import ImageNotFound
+
     try:
         client.images.get(image_name)
     except ImageNotFound:
@@ -1624,21 +1681,32 @@ def update_layer_status(layers_info: dict[str, str], layer_id: str, layer_status
         layers_info[layer_id] = "•"
 
 
-def process_pull_line(
-    line: dict[str, Any], layers_info: dict[str, str], status: Any, last_update: str
-) -> str:
+@dataclass
+class PullProgress:
+    """Layer state for one streamed image pull.
+
+    ``completed`` is kept in step with ``layers`` so each progress line costs
+    O(1) instead of recounting every layer.
+    """
+
+    layers: dict[str, str] = field(default_factory=dict)
+    completed: int = 0
+    last_update: str = ""
+
+
+def process_pull_line(line: dict[str, Any], progress: PullProgress, status: Any) -> None:
     if "id" in line and "status" in line:
         layer_id = line["id"]
-        update_layer_status(layers_info, layer_id, line["status"])
-
-        completed = sum(1 for v in layers_info.values() if v == "✓")
-        total = len(layers_info)
+        was_complete = progress.layers.get(layer_id) == "✓"
+        update_layer_status(progress.layers, layer_id, line["status"])
+        progress.completed += (progress.layers[layer_id] == "✓") - was_complete
 
-        if total > 0:
-            update_msg = f"[bold cyan]Progress: {completed}/{total} layers complete"
-            if update_msg != last_update:
-                status.update(update_msg)
-                return update_msg
+        update_msg = (
+            f"[bold cyan]Progress: {progress.completed}/{len(progress.layers)} layers complete"
+        )
+        if update_msg != progress.last_update:
+            status.update(update_msg)
+            progress.last_update = update_msg
 
     elif "status" in line and "id" not in line:
         global_status = line["status"]
@@ -1649,8 +1717,6 @@ def process_pull_line(
         elif "Status:" in global_status:
             status.update("[bold cyan]Finalizing...")
 
-    return last_update
-
 
 def validate_config_file(config_path: str) -> Path:
     console = Console()
@@ -16,18 +16,18 @@ import contextlib
 import json
 import logging
 from datetime import UTC, datetime
-from pathlib import Path
 from typing import Any
 
 import requests
 
 from strix.config.loader import load_settings
+from strix.core.paths import STRIX_HOME
 from strix.utils.secret_files import write_secret_text
 
 
 logger = logging.getLogger(__name__)
 
-AUTH_PATH = Path.home() / ".strix" / "viewer-auth.json"
+AUTH_PATH = STRIX_HOME / "viewer-auth.json"
 
 _OTP_TIMEOUT = 15
 _SEND_TIMEOUT = 30
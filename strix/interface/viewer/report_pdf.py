@@ -405,6 +405,16 @@ def _cover(
     ]
 
 
+_CODE_SPAN_RE = re.compile(r"`([^`]+)`")
+_BOLD_STAR_RE = re.compile(r"\*\*(.+?)\*\*")
+_BOLD_UNDERSCORE_RE = re.compile(r"__(.+?)__")
+_ITALIC_RE = re.compile(r"\*(.+?)\*")
+_CODE_PLACEHOLDER_RE = re.compile(r"\x00(\d+)\x00")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+_ORDERED_ITEM_RE = re.compile(r"^(\d+)\.\s+(.*)$")
+_UNORDERED_ITEM_RE = re.compile(r"^[-*+]\s+(.*)$")
+
+
 def _inline_md(text: str) -> str:
     """Convert inline markdown (bold, italic, `code`) to reportlab markup.
 
@@ -417,22 +427,22 @@ def _inline_md(text: str) -> str:
         codes.append(match.group(1))
         return f"\x00{len(codes) - 1}\x00"
 
-    seg = html.escape(re.sub(r"`([^`]+)`", _stash, text))
-    seg = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", seg)
-    seg = re.sub(r"__(.+?)__", r"<b>\1</b>", seg)
-    seg = re.sub(r"\*(.+?)\*", r"<i>\1</i>", seg)
+    seg = html.escape(_CODE_SPAN_RE.sub(_stash, text))
+    seg = _BOLD_STAR_RE.sub(r"<b>\1</b>", seg)
+    seg = _BOLD_UNDERSCORE_RE.sub(r"<b>\1</b>", seg)
+    seg = _ITALIC_RE.sub(r"<i>\1</i>", seg)
 
     def _restore(match: re.Match[str]) -> str:
         inner = html.escape(codes[int(match.group(1))])
         return f'<font face="{_MONO}" color="#b31d28">{inner}</font>'
 
-    return re.sub(r"\x00(\d+)\x00", _restore, seg)
+    return _CODE_PLACEHOLDER_RE.sub(_restore, seg)
 
 
 def _strip_leading_heading(md: str) -> str:
     """Drop a single leading markdown heading (each section adds its own title)."""
     lines = md.lstrip("\n").split("\n")
-    if lines and re.match(r"^#{1,6}\s+", lines[0].strip()):
+    if lines and _HEADING_RE.match(lines[0].strip()):
         return "\n".join(lines[1:]).lstrip("\n")
     return md
 
@@ -475,15 +485,15 @@ def _markdown_flowables(  # noqa: PLR0915 - cohesive block parser, splitting hur
             flush_bullets()
             i += 1
             continue
-        heading = re.match(r"^(#{1,6})\s+(.*)$", stripped)
+        heading = _HEADING_RE.match(stripped)
         if heading:
             flush_para()
             flush_bullets()
             flow.append(Paragraph(_inline_md(heading.group(2)), styles["md_heading"]))
             i += 1
             continue
-        ordered = re.match(r"^(\d+)\.\s+(.*)$", stripped)
-        unordered = re.match(r"^[-*+]\s+(.*)$", stripped)
+        ordered = _ORDERED_ITEM_RE.match(stripped)
+        unordered = _UNORDERED_ITEM_RE.match(stripped)
         if ordered:
             flush_para()
             bullets.append((f"{ordered.group(1)}.", ordered.group(2)))
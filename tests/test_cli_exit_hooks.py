@@ -0,0 +1,38 @@
+"""Tests for the headless CLI's process exit hooks."""
+
+from __future__ import annotations
+
+import atexit
+import signal
+from typing import TYPE_CHECKING, Any
+
+from strix.interface import cli
+
+
+if TYPE_CHECKING:
+    import pytest
+
+
+class _FakeReportState:
+    def __init__(self) -> None:
+        self.cleanups: list[str | None] = []
+
+    def cleanup(self, status: str | None = None) -> None:
+        self.cleanups.append(status)
+
+
+def test_exit_hooks_register_once_and_follow_latest_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    registered: list[Any] = []
+    monkeypatch.setattr(atexit, "register", registered.append)
+    monkeypatch.setattr(signal, "signal", lambda *_args: None)
+    monkeypatch.setattr(cli, "_exit_hooks_installed", False)
+    monkeypatch.setattr(cli, "_active_report_state", None)
+    first, second = _FakeReportState(), _FakeReportState()
+
+    cli._install_exit_hooks(first)  # type: ignore[arg-type]
+    cli._install_exit_hooks(second)  # type: ignore[arg-type]
+    cli._cleanup_on_exit()
+
+    assert registered == [cli._cleanup_on_exit]
+    assert first.cleanups == []
+    assert second.cleanups == [None]
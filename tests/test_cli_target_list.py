@@ -86,6 +86,26 @@ def test_parse_arguments_rejects_resume_with_target_list(
     assert "Cannot combine --resume with --target/--target-list" in capsys.readouterr().err
 
 
+def test_parse_arguments_reports_every_invalid_target(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    target_list = tmp_path / "targets.txt"
+    target_list.write_text("https://ok.com/\nnot a target\n", encoding="utf-8")
+    _stub_settings(monkeypatch)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["strix", "-t", "also bad", "--target-list", str(target_list), "-n"],
+    )
+
+    with pytest.raises(SystemExit):
+        cli_main.parse_arguments()
+
+    err = capsys.readouterr().err
+    assert "Invalid target 'also bad'" in err
+    assert "Invalid target 'not a target'" in err
+
+
 def _write_run_record(runs_dir: Path, run_name: str, record: dict[str, Any]) -> None:
     """Write a resumable run: its record plus the agent snapshot resume needs."""
     run_dir = runs_dir / run_name
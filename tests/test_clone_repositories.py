@@ -0,0 +1,78 @@
+"""Tests for concurrent repository cloning in interface.utils."""
+
+from __future__ import annotations
+
+import subprocess
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from strix.interface import utils
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_clone_repositories_preserves_input_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_clone(
+        _git: str, repo_url: str, temp_dir: Path, dest_name: str | None, _env: object = None
+    ) -> str:
+        # The first repo finishes last so completion order differs from input order.
+        time.sleep(0.05 if repo_url.endswith("a.git") else 0)
+        return str(temp_dir / (dest_name or repo_url))
+
+    monkeypatch.setattr(utils, "_clone_into", fake_clone)
+    paths = utils.clone_repositories(
+        [("https://x/a.git", "a"), ("https://x/b.git", "b"), ("https://x/c.git", None)],
+        "run-order",
+    )
+    assert [p.rsplit("/", 1)[-1] for p in paths] == ["a", "b", "c.git"]
+
+
+def test_clone_repositories_propagates_clone_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_clone(
+        _git: str, repo_url: str, temp_dir: Path, dest_name: str | None, _env: object = None
+    ) -> str:
+        if dest_name == "bad":
+            raise ValueError(f"Could not clone repository {repo_url}: nope")
+        return str(temp_dir / (dest_name or "repo"))
+
+    monkeypatch.setattr(utils, "_clone_into", fake_clone)
+    with pytest.raises(ValueError, match="Could not clone"):
+        utils.clone_repositories([("u1", "ok"), ("u2", "bad")], "run-err")
+
+
+def test_clone_repositories_empty_is_noop() -> None:
+    assert utils.clone_repositories([], "run-empty") == []
+
+
+def test_parallel_clones_disable_terminal_prompts(monkeypatch: pytest.MonkeyPatch) -> None:
+    envs: list[str | None] = []
+
+    def fake_run(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        env = kwargs["env"]
+        envs.append(env.get("GIT_TERMINAL_PROMPT") if isinstance(env, dict) else None)
+        if cmd[2] == "u2":
+            raise subprocess.CalledProcessError(
+                128, cmd, stderr="fatal: could not read Username: terminal prompts disabled"
+            )
+        return subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(utils.subprocess, "run", fake_run)
+    with pytest.raises(ValueError, match=r"Could not clone repository u2: .*prompts disabled"):
+        utils.clone_repositories([("u1", "one"), ("u2", "two")], "run-auth")
+    assert envs == ["0", "0"]
+
+
+def test_single_clone_may_prompt(monkeypatch: pytest.MonkeyPatch) -> None:
+    envs: list[object] = []
+
+    def fake_run(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        envs.append(kwargs["env"])
+        return subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(utils.subprocess, "run", fake_run)
+    utils.clone_repositories([("u1", "one")], "run-single")
+    assert envs == [None]
@@ -10,7 +10,7 @@ from pydantic import AliasChoices, Field, ValidationError
 from pydantic.fields import FieldInfo
 
 from strix.config import loader
-from strix.config.settings import ContextSettings
+from strix.config.settings import ContextSettings, Settings
 
 
 if TYPE_CHECKING:
@@ -156,6 +156,24 @@ def test_aliases_for_no_alias() -> None:
     assert loader._aliases_for(FieldInfo()) == []
 
 
+def test_tracked_fields_cover_every_alias_uppercased() -> None:
+    rows = {(sub, fname): aliases for sub, fname, aliases in loader._TRACKED_FIELDS}
+    assert rows[("llm", "api_key")] == ("LLM_API_KEY", "OPENAI_API_KEY")
+    assert rows[("runtime", "image")] == ("STRIX_IMAGE",)
+    assert all(alias.isupper() for aliases in rows.values() for alias in aliases)
+
+
+def test_tracked_fields_match_settings_schema() -> None:
+    # Every sub-model field must be persistable; a field added without an env
+    # alias would silently drop out of the precomputed table.
+    schema = {
+        (sub_name, fname)
+        for sub_name, sub_finfo in Settings.model_fields.items()
+        for fname in sub_finfo.annotation.model_fields  # type: ignore[union-attr]
+    }
+    assert {(sub, fname) for sub, fname, _ in loader._TRACKED_FIELDS} == schema
+
+
 # --------------------------------------------------------------------------- #
 # apply_config_override + load_settings round-trip
 # --------------------------------------------------------------------------- #
@@ -216,3 +234,50 @@ def test_persist_current_sets_0600_mode(tmp_path: Path, monkeypatch: pytest.Monk
     loader.persist_current()
 
     assert target.stat().st_mode & 0o777 == 0o600
+
+
+def test_persist_current_keeps_file_only_keys(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "cli-config.json"
+    target.write_text(
+        json.dumps({"env": {"STRIX_LLM": "file-model", "OPENAI_API_KEY": "sk-old"}}),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("LLM_API_KEY", "sk-new")
+    loader.apply_config_override(target)
+
+    loader.persist_current()
+
+    assert json.loads(target.read_text(encoding="utf-8")) == {
+        "env": {"STRIX_LLM": "file-model", "LLM_API_KEY": "sk-new"}
+    }
+
+
+def test_persist_current_skips_unchanged_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("STRIX_LLM", "persisted-model")
+    target = tmp_path / "cli-config.json"
+    loader.apply_config_override(target)
+    loader.persist_current()
+    written: list[Path] = []
+    monkeypatch.setattr(loader, "write_secret_text", lambda path, _text: written.append(path))
+
+    loader.persist_current()
+
+    assert written == []
+
+
+def test_persist_current_creates_missing_file_without_tracked_env(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for key in loader._TRACKED_ENV_VARS:
+        monkeypatch.delenv(key, raising=False)
+    target = tmp_path / "cli-config.json"
+    loader.apply_config_override(target)
+
+    loader.persist_current()
+
+    assert json.loads(target.read_text(encoding="utf-8")) == {"env": {}}
+    assert target.stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,66 @@
+"""Tests for the Docker connection and image pull helpers in interface.utils."""
+
+from __future__ import annotations
+
+import docker
+import pytest
+
+from strix.interface import utils
+
+
+def test_check_docker_connection_reuses_the_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    built: list[object] = []
+
+    def fake_from_env() -> object:
+        built.append(object())
+        return built[-1]
+
+    monkeypatch.setattr(utils, "_docker_client", None)
+    monkeypatch.setattr(docker, "from_env", fake_from_env)
+
+    first = utils.check_docker_connection()
+    assert utils.check_docker_connection() is first
+    assert len(built) == 1
+
+
+def test_check_docker_connection_retries_after_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    def unavailable() -> object:
+        raise docker.errors.DockerException("daemon down")
+
+    monkeypatch.setattr(utils, "_docker_client", None)
+    monkeypatch.setattr(docker, "from_env", unavailable)
+    with pytest.raises(RuntimeError, match="Docker not available"):
+        utils.check_docker_connection()
+
+    client = object()
+    monkeypatch.setattr(docker, "from_env", lambda: client)
+    assert utils.check_docker_connection() is client
+
+
+class _Status:
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    def update(self, message: str) -> None:
+        self.messages.append(message)
+
+
+def test_process_pull_line_tracks_completed_layers_incrementally() -> None:
+    progress = utils.PullProgress()
+    status = _Status()
+    for line in (
+        {"status": "Pulling from strix/sandbox"},
+        {"id": "a", "status": "Downloading"},
+        {"id": "b", "status": "Already exists"},
+        {"id": "a", "status": "Pull complete"},
+        {"id": "a", "status": "Pull complete"},
+    ):
+        utils.process_pull_line(line, progress, status)
+
+    assert progress.completed == 2
+    assert status.messages == [
+        "[bold cyan]Fetching image manifest...",
+        "[bold cyan]Progress: 0/1 layers complete",
+        "[bold cyan]Progress: 1/2 layers complete",
+        "[bold cyan]Progress: 2/2 layers complete",
+    ]
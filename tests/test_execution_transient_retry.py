@@ -88,6 +88,22 @@ def test_client_errors_are_not_transient() -> None:
     assert execution._is_transient_model_error(ValueError("nope")) is False
 
 
+def test_retry_delay_honours_retry_after_header() -> None:
+    rate_limited = RateLimitError(
+        "slow down",
+        response=httpx.Response(429, headers={"retry-after": "7"}, request=_request()),
+        body=None,
+    )
+    assert execution._transient_model_retry_delay(1, rate_limited) == 7.0
+
+
+def test_retry_delay_is_jittered_within_bounds() -> None:
+    delays = {execution._transient_model_retry_delay(3) for _ in range(50)}
+    assert len(delays) > 1
+    assert all(4.0 <= delay <= 12.0 for delay in delays)
+    assert execution._transient_model_retry_delay(20) <= 90.0
+
+
 class _FakeStream:
     def __init__(self, exc: BaseException | None = None) -> None:
         self._exc = exc
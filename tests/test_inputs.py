@@ -3,17 +3,34 @@
 from __future__ import annotations
 
 from itertools import pairwise
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import litellm
 import pytest
 
+from strix.config.models import bedrock_route_supports_prompt_caching, model_supports_reasoning
 from strix.core.inputs import (
     build_root_task,
     build_scope_context,
     child_initial_input,
     make_model_settings,
 )
+from strix.core.sessions import scrub_images_from_items
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(autouse=True)
+def _clear_model_capability_caches() -> Iterator[None]:
+    # Some tests patch litellm.model_cost; answers cached against the patched
+    # table must not leak into other tests in either direction.
+    bedrock_route_supports_prompt_caching.cache_clear()
+    model_supports_reasoning.cache_clear()
+    yield
+    bedrock_route_supports_prompt_caching.cache_clear()
+    model_supports_reasoning.cache_clear()
 
 
 def _child_kwargs(parent_history: list[Any]) -> dict[str, Any]:
@@ -50,6 +67,38 @@ def test_child_initial_input_single_message_with_history() -> None:
     assert "Audit the login flow." in content
 
 
+def test_child_initial_input_scrubs_inherited_images() -> None:
+    history = [
+        {
+            "type": "function_call_output",
+            "call_id": "c1",
+            "output": [
+                {"type": "input_text", "text": "page"},
+                {"type": "input_image", "image_url": "data:image/png;base64,AAAA"},
+            ],
+        },
+    ]
+    content = child_initial_input(**_child_kwargs(history))[0]["content"]
+
+    assert "data:image/png" not in content
+    assert "screenshot omitted from inherited context" in content
+    assert history[0]["output"][1]["type"] == "input_image"
+
+
+def test_scrub_images_shares_image_free_items() -> None:
+    text_item = {"role": "assistant", "content": [{"type": "output_text", "text": "hi"}]}
+    image_item = {
+        "type": "function_call_output",
+        "output": [{"type": "input_image", "image_url": "x"}, {"type": "input_text"}],
+    }
+
+    scrubbed = scrub_images_from_items([text_item, image_item])
+
+    assert scrubbed[0] is text_item
+    assert scrubbed[1] is not image_item
+    assert scrubbed[1]["output"][1] is image_item["output"][1]
+
+
 @pytest.mark.parametrize(
     "parent_history",
     [[], [{"role": "assistant", "content": "previous work"}]],
@@ -247,3 +247,14 @@ def test_dedupe_collapses_the_same_path() -> None:
     assert dedupe_local_targets([_local_target("/repo"), _local_target("/repo")]) == [
         _local_target("/repo")
     ]
+
+
+def test_infer_target_type_treats_a_path_through_a_file_as_absent(tmp_path: Path) -> None:
+    (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+    with pytest.raises(ValueError, match="Invalid target"):
+        infer_target_type(str(tmp_path / "notes.txt" / "child"))
+
+
+def test_infer_target_type_treats_an_embedded_nul_as_absent() -> None:
+    with pytest.raises(ValueError, match="Invalid target"):
+        infer_target_type("foo\x00bar")
@@ -4,7 +4,7 @@ from pathlib import Path
 import pytest
 
 import strix.skills as skills_mod
-from strix.agents.prompt import render_system_prompt
+from strix.agents.prompt import _system_prompt_template, render_system_prompt
 from strix.skills import (
     get_all_skill_names,
     get_available_skills,
@@ -232,3 +232,35 @@ def test_builtin_skill_still_loads_when_not_overridden(tmp_path: Path) -> None:
 def test_missing_skill_is_skipped(tmp_path: Path) -> None:
     register_skill_dir(tmp_path)
     assert load_skills(["does_not_exist"]) == {}
+
+
+def test_system_prompt_template_is_compiled_once_per_search_path() -> None:
+    render_system_prompt(scan_mode="quick", is_root=True)
+    before = _system_prompt_template.cache_info()
+    render_system_prompt(scan_mode="deep", is_root=False)
+    after = _system_prompt_template.cache_info()
+
+    assert after.misses == before.misses
+    assert after.hits == before.hits + 1
+
+
+def test_system_prompt_picks_up_an_edited_skill(tmp_path: Path) -> None:
+    register_skill_dir(tmp_path)
+    _write_skill(tmp_path, "extra", "widget", "widget body v1")
+    assert "widget body v1" in render_system_prompt(skills=["extra/widget"])
+
+    _write_skill(tmp_path, "extra", "widget", "widget body v2, now longer")
+    assert "widget body v2" in render_system_prompt(skills=["extra/widget"])
+
+
+def test_system_prompt_renders_non_json_context() -> None:
+    prompt = render_system_prompt(
+        scan_mode="quick",
+        system_prompt_context={
+            "scope_source": Path("custom"),
+            "authorization_source": "test",
+            "authorized_targets": [{"type": "x", "value": "y"}],
+        },
+    )
+
+    assert "- Scope source: custom" in prompt
@@ -0,0 +1,38 @@
+"""Tests for the vulnerability/usage stats text shown in the CLI panels."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from strix.interface.utils import build_final_stats_text
+
+
+def _state(severities: list[str], usage: dict[str, Any] | None = None) -> Any:
+    return SimpleNamespace(
+        vulnerability_reports=[{"severity": s} for s in severities],
+        run_record={"auth_mode": "api_key"},
+        get_total_llm_usage=lambda: usage or {},
+    )
+
+
+def test_final_stats_breaks_down_severities_in_fixed_order() -> None:
+    text = build_final_stats_text(_state(["low", "CRITICAL", "low", "bogus"]))
+    first_line = text.plain.split("\n", 1)[0]
+    assert first_line == "Vulnerabilities  CRITICAL: 1 | LOW: 2 (Total: 4)"
+    styles = {text.plain[span.start : span.end]: str(span.style) for span in text.spans}
+    assert styles["CRITICAL: "] == "#dc2626"
+    assert styles["2"] == "bold #65a30d"
+
+
+def test_final_stats_reports_clean_run() -> None:
+    text = build_final_stats_text(_state([]))
+    assert text.plain.startswith("Vulnerabilities  0 (No exploitable vulnerabilities detected)\n")
+
+
+def test_final_stats_includes_token_usage() -> None:
+    usage = {"requests": 3, "input_tokens": 1500, "output_tokens": 20, "cost": 0.5}
+    text = build_final_stats_text(_state([], usage))
+    assert "Input Tokens 1.5K" in text.plain
+    assert "Output Tokens 20" in text.plain
+    assert "Cost $0.5000" in text.plain
@@ -496,6 +496,28 @@ def test_terminal_event_history_is_bounded_without_changing_durable_sessions() -
     assert projected[-1]["data"]["content"] == "message-10049"
 
 
+def test_event_changes_since_returns_events_in_change_order() -> None:
+    controller = TuiController(args())
+    view = controller.live_view
+    for index in range(3):
+        view.record_user_message("agent", f"message-{index}")
+    cursor, _ = view.event_snapshot()
+    first, second, _third = view.events
+
+    view._bump_event(first)
+    view.record_user_message("agent", "message-3")
+    view._bump_event(second)
+    next_cursor, changed = view.event_changes_since(cursor)
+
+    assert next_cursor == cursor + 3
+    assert [event["data"]["content"] for event in changed] == [
+        "message-0",
+        "message-3",
+        "message-1",
+    ]
+    assert view.event_changes_since(next_cursor) == (next_cursor, [])
+
+
 @pytest.mark.asyncio
 async def test_oversized_command_frame_is_rejected_before_payload_read() -> None:
     backend, child = socket.socketpair()
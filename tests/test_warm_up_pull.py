@@ -0,0 +1,149 @@
+"""Tests for overlapping the headless model warm-up with the image pull."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import threading
+import time
+
+import pytest
+
+from strix.interface import environment
+
+
+# ``strix.interface.main`` the attribute is the CLI entry point function, so
+# fetch the module itself.
+main = importlib.import_module("strix.interface.main")
+
+
+def test_pull_runs_alongside_successful_warm_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    pulled = threading.Event()
+
+    async def warm_up(**_kwargs: object) -> None:
+        await asyncio.sleep(0)
+        assert pulled.wait(5)
+
+    monkeypatch.setattr(main, "warm_up_llm", warm_up)
+    monkeypatch.setattr(main, "pull_docker_image", lambda **_kwargs: pulled.set())
+
+    main._warm_up_while_pulling()
+
+    assert pulled.is_set()
+
+
+def test_failed_warm_up_does_not_wait_for_pull(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = threading.Event()
+
+    async def warm_up(**_kwargs: object) -> None:
+        await asyncio.sleep(0.05)
+        raise RuntimeError("model unreachable")
+
+    monkeypatch.setattr(main, "warm_up_llm", warm_up)
+    monkeypatch.setattr(main, "pull_docker_image", lambda **_kwargs: release.wait(30))
+
+    started = time.monotonic()
+    try:
+        with pytest.raises(RuntimeError, match="model unreachable"):
+            main._warm_up_while_pulling()
+        assert time.monotonic() - started < 5
+    finally:
+        release.set()
+
+
+def test_failed_warm_up_silences_the_pull_before_returning(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stops: list[threading.Event] = []
+    pulling = threading.Event()
+
+    async def warm_up(**_kwargs: object) -> None:
+        await asyncio.to_thread(pulling.wait, 5)
+        raise RuntimeError("model unreachable")
+
+    def pull(*, stop: threading.Event) -> None:
+        stops.append(stop)
+        pulling.set()
+        stop.wait(30)
+
+    monkeypatch.setattr(main, "warm_up_llm", warm_up)
+    monkeypatch.setattr(main, "pull_docker_image", pull)
+
+    with pytest.raises(RuntimeError, match="model unreachable"):
+        main._warm_up_while_pulling()
+
+    # The caller prints its error panel next; the pull must already be quiet.
+    assert len(stops) == 1
+    assert stops[0].is_set()
+
+
+def test_failed_pull_cancels_the_warm_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def warm_up(**_kwargs: object) -> None:
+        await asyncio.sleep(30)
+
+    def pull(**_kwargs: object) -> None:
+        raise SystemExit(1)
+
+    monkeypatch.setattr(main, "warm_up_llm", warm_up)
+    monkeypatch.setattr(main, "pull_docker_image", pull)
+
+    started = time.monotonic()
+    with pytest.raises(SystemExit):
+        main._warm_up_while_pulling()
+    assert time.monotonic() - started < 5
+
+
+def test_exit_before_first_await_never_starts_pull(monkeypatch: pytest.MonkeyPatch) -> None:
+    pulls: list[str] = []
+
+    async def warm_up(**_kwargs: object) -> None:
+        raise SystemExit(1)
+
+    monkeypatch.setattr(main, "warm_up_llm", warm_up)
+    monkeypatch.setattr(main, "pull_docker_image", lambda **_kwargs: pulls.append("pull"))
+
+    with pytest.raises(SystemExit):
+        main._warm_up_while_pulling()
+
+    assert pulls == []
+
+
+def test_pull_failure_surfaces_on_main_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def warm_up(**_kwargs: object) -> None:
+        await asyncio.sleep(0)
+
+    def pull(**_kwargs: object) -> None:
+        raise SystemExit(1)
+
+    monkeypatch.setattr(main, "warm_up_llm", warm_up)
+    monkeypatch.setattr(main, "pull_docker_image", pull)
+
+    with pytest.raises(SystemExit):
+        main._warm_up_while_pulling()
+
+
+def test_stoppable_pull_prints_plain_lines_and_goes_quiet(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    stop = threading.Event()
+
+    class _Api:
+        def pull(self, *_args: object, **_kwargs: object) -> object:
+            yield {"status": "Pulling from strix/sandbox"}
+            stop.set()
+            yield {"id": "a", "status": "Downloading"}
+
+    class _Client:
+        api = _Api()
+
+    monkeypatch.setattr(environment, "_ready_images", set())
+    monkeypatch.setattr(environment, "check_docker_connection", _Client)
+    monkeypatch.setattr(environment, "image_exists", lambda *_args: False)
+
+    environment.pull_docker_image(stop=stop)
+
+    out = capsys.readouterr().out
+    assert "Fetching image manifest..." in out
+    assert "layers complete" not in out
+    assert "Docker image ready" not in out
+    assert environment._ready_images == set()